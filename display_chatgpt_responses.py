@@ -1,77 +1,206 @@
 #!/usr/bin/env python3
 import os
 import sys
+import mmap
+import hashlib
 import logging
+import tempfile
 import argparse
-from src.chatgpt_script_generator import clean_chatgpt_response
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+RESPONSE_SUFFIX = "_response.txt"
+RESPONSE_SUFFIX_LEN = len(RESPONSE_SUFFIX)
+# Name given to a response file by --save in cleaned_responses
+CLEANED_SUFFIX = "_cleaned.txt"
+
+# Files smaller than this are read directly; mmap setup costs more than it saves
+MMAP_THRESHOLD = 16384
+
+def read_response_file(path: str) -> bytes:
+    """Read a response file, memory-mapping it when it is large enough to pay off."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return f.read()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:]
+
+def _cache_path(cache_dir: str, stem: str, raw: bytes) -> str:
+    """Return the cache entry path for a response, keyed by a hash of its raw content."""
+    key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"{stem}.{key}.txt")
+
+def _write_cache_entry(cache_path: str, stem: str, script: str):
+    """Atomically write a cleaned script to the cache and prune stale entries for the same slide."""
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f".{stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(script)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+    
+    keep = os.path.basename(cache_path)
+    with os.scandir(cache_dir) as it:
+        for e in it:
+            if e.name != keep and e.name.startswith(f"{stem}.") and e.name.endswith(".txt"):
+                os.unlink(e.path)
+
+def _scan_response_files(directory: str, suffix: str = RESPONSE_SUFFIX) -> list:
+    """Return the response file entries in a directory, sorted numerically by slide number."""
+    # A single scandir pass; DirEntry caches name, path, type and stat info
+    with os.scandir(directory) as it:
+        entries = [e for e in it
+                   if e.is_file(follow_symlinks=False)
+                   and len(e.name) > len(suffix)
+                   and e.name.endswith(suffix)]
+    # Extract slide number from filename and sort numerically
+    entries.sort(key=lambda e: int(e.name.split('_')[1]))
+    return entries
+
 def load_chatgpt_scripts(responses_dir: str, use_cleaned: bool = False):
-    """Load ChatGPT-4o generated scripts from response files and clean them."""
+    """Load ChatGPT-4o generated scripts from response files and clean them.
+    
+    Yields (filename, script) tuples one at a time in slide order.
+    """
     logging.info(f"Loading ChatGPT-4o scripts from {responses_dir}")
     
     # Check if we have cleaned responses available
     cleaned_dir = os.path.join(os.path.dirname(responses_dir), "cleaned_responses")
-    if use_cleaned and os.path.exists(cleaned_dir) and os.listdir(cleaned_dir):
+    # The cleaning cache lives apart from cleaned_responses so -c never mistakes it for saved scripts
+    cache_dir = os.path.join(os.path.dirname(responses_dir), ".cache", "cleaned")
+    cleaned_entries = None
+    if use_cleaned and os.path.isdir(cleaned_dir):
+        cleaned_entries = _scan_response_files(cleaned_dir, CLEANED_SUFFIX)
+    if cleaned_entries:
         logging.info(f"Using pre-cleaned responses from {cleaned_dir}")
         responses_dir = cleaned_dir
-    
-    if not os.path.exists(responses_dir):
+        entries = cleaned_entries
+    elif not os.path.exists(responses_dir):
         logging.error(f"Responses directory '{responses_dir}' not found.")
-        return []
+        return
+    else:
+        entries = _scan_response_files(responses_dir)
     
-    # Get all response files and sort them numerically by slide number
-    response_files = [f for f in os.listdir(responses_dir) if f.endswith("_response.txt")]
-    # Extract slide number from filename and sort numerically
-    response_files.sort(key=lambda f: int(f.split('_')[1]))
+    # Promote a complete set of cleaned responses that is newer than every raw response
+    if not use_cleaned and entries and os.path.isdir(cleaned_dir):
+        cleaned_entries = _scan_response_files(cleaned_dir, CLEANED_SUFFIX)
+        if len(cleaned_entries) == len(entries):
+            raw_mtime = max(e.stat(follow_symlinks=False).st_mtime for e in entries)
+            cleaned_mtime = min(e.stat(follow_symlinks=False).st_mtime for e in cleaned_entries)
+            if cleaned_mtime >= raw_mtime:
+                logging.info(f"Cleaned responses in {cleaned_dir} are up to date; skipping cleaning")
+                responses_dir = cleaned_dir
+                entries = cleaned_entries
+                use_cleaned = True
     
-    if not response_files:
+    if not entries:
         logging.error(f"No response files found in '{responses_dir}'.")
-        return []
+        return
     
-    scripts = []
-    for response_file in response_files:
-        response_path = os.path.join(responses_dir, response_file)
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+    
+    # Only pull in the script generator module when there is cleaning to do
+    if not use_cleaned:
+        from src.chatgpt_script_generator import clean_chatgpt_response
+        clean = clean_chatgpt_response
+    
+    def load_one(entry):
+        """Read and (optionally) clean a single response file.
+        
+        Returns (filename, script, cleaned, placeholder), or None if the file could not be read.
+        """
+        response_file = entry.name
         try:
-            with open(response_path, 'r', encoding='utf-8') as f:
-                script = f.read().strip()
-                
-                # If we're not using pre-cleaned responses, clean them now
-                if not use_cleaned:
-                    script = clean_chatgpt_response(script)
-                    logging.info(f"Cleaned script from {response_file}")
-                
-                if script:
-                    scripts.append((response_file, script))
-                    logging.info(f"Loaded script from {response_file}")
+            # Trim on the raw bytes so empty files never get decoded or cleaned
+            raw = read_response_file(entry.path).strip()
+            script = raw.decode('utf-8') if raw else ""
+            cleaned = False
+            
+            # If we're not using pre-cleaned responses, clean them now (or reuse a cached result)
+            if not use_cleaned and raw:
+                stem = response_file[:-RESPONSE_SUFFIX_LEN]
+                cache_path = _cache_path(cache_dir, stem, raw)
+                if os.path.exists(cache_path):
+                    with open(cache_path, 'r', encoding='utf-8') as f:
+                        script = f.read()
+                    if debug:
+                        logging.debug(f"Using cached cleaned script for {response_file}")
                 else:
-                    logging.warning(f"Script from {response_file} was empty after cleaning. Using placeholder.")
-                    scripts.append((response_file, f"Script for slide could not be generated properly."))
+                    script = clean(script)
+                    _write_cache_entry(cache_path, stem, script)
+                    cleaned = True
+                    if debug:
+                        logging.debug(f"Cleaned script from {response_file}")
+            
+            if script:
+                if debug:
+                    logging.debug(f"Loaded script from {response_file}")
+                return (response_file, script, cleaned, False)
+            logging.warning(f"Script from {response_file} was empty after cleaning. Using placeholder.")
+            return (response_file, f"Script for slide could not be generated properly.", cleaned, True)
         except Exception as e:
-            logging.error(f"Error reading response file {response_path}: {e}")
+            logging.error(f"Error reading response file {entry.path}: {e}")
+            return None
     
-    return scripts
+    # Files are independent, so overlap disk reads with cleaning. Submit through a sliding window
+    # (unlike map(), which submits everything up front) so only a bounded number of scripts is in memory
+    n_loaded = n_cleaned = n_empty = 0
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(entries))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        it = iter(entries)
+        pending = deque(executor.submit(load_one, e) for e in islice(it, max_workers * 2))
+        while pending:
+            result = pending.popleft().result()
+            entry = next(it, None)
+            if entry is not None:
+                pending.append(executor.submit(load_one, entry))
+            if result is None:
+                continue
+            response_file, script, cleaned, placeholder = result
+            n_loaded += 1
+            n_cleaned += cleaned
+            n_empty += placeholder
+            yield response_file, script
+    
+    logging.info(f"Loaded {n_loaded} scripts ({n_cleaned} cleaned, {n_empty} placeholders)")
 
 def save_cleaned_scripts(scripts, output_dir: str):
-    """Save cleaned scripts to files."""
+    """Save cleaned scripts to files as they stream past, passing each one through."""
     cleaned_dir = os.path.join(output_dir, "cleaned_responses")
     os.makedirs(cleaned_dir, exist_ok=True)
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
     
     for filename, script in scripts:
         # Create a new filename for the cleaned script
-        cleaned_filename = filename.replace("_response.txt", "_cleaned.txt")
-        cleaned_path = os.path.join(cleaned_dir, cleaned_filename)
+        cleaned_path = f"{cleaned_dir}{os.sep}{filename.replace(RESPONSE_SUFFIX, CLEANED_SUFFIX)}"
         
+        # Encode once and write with a single syscall, bypassing the text I/O stack
+        data = script.encode('utf-8')
         try:
-            with open(cleaned_path, 'w', encoding='utf-8') as f:
-                f.write(script)
-            logging.info(f"Saved cleaned script to {cleaned_path}")
-        except Exception as e:
+            fd = os.open(cleaned_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            if debug:
+                logging.debug(f"Saved cleaned script to {cleaned_path}")
+        except OSError as e:
             logging.error(f"Error saving cleaned script to {cleaned_path}: {e}")
-    
-    return cleaned_dir
+        
+        yield filename, script
+
+# Number of script previews written to stdout at a time
+PREVIEW_BATCH_SIZE = 64
 
 def main():
     """Main function to display ChatGPT-4o scripts."""
@@ -82,21 +211,30 @@ def main():
     
     args = parser.parse_args()
     
-    # Load scripts
+    # Load scripts lazily so only a small window of scripts is held in memory at a time
     scripts = load_chatgpt_scripts(args.responses, args.cleaned)
     
-    # Save cleaned scripts if requested
-    if args.save and scripts:
+    # Save cleaned scripts as they are loaded if requested
+    if args.save:
         output_dir = os.path.dirname(args.responses)
-        cleaned_dir = save_cleaned_scripts(scripts, output_dir)
-        print(f"\nSaved cleaned scripts to {cleaned_dir}")
-    
-    # Print scripts
-    if scripts:
-        print(f"\nLoaded {len(scripts)} scripts:")
-        for i, (filename, script) in enumerate(scripts):
-            print(f"\n--- Script {i+1}/{len(scripts)} ({filename}) ---")
-            print(f"{script[:200]}...")  # Print first 200 chars
+        scripts = save_cleaned_scripts(scripts, output_dir)
+    
+    # Print scripts, buffering previews so stdout is written once per batch
+    count = 0
+    previews = []
+    for filename, script in scripts:
+        count += 1
+        previews.append(f"\n--- Script {count} ({filename}) ---\n{script[:200]}...\n")  # First 200 chars
+        if len(previews) >= PREVIEW_BATCH_SIZE:
+            sys.stdout.write("".join(previews))
+            previews.clear()
+    if previews:
+        sys.stdout.write("".join(previews))
+    
+    if count:
+        print(f"\nLoaded {count} scripts.")
+        if args.save:
+            print(f"Saved cleaned scripts to {os.path.join(output_dir, 'cleaned_responses')}")
     else:
         print("No scripts loaded.")
 
@@ -7,105 +7,501 @@ This version avoids the XCB issues that occur with Tkinter.
 import os
 import sys
 import logging
+import logging.handlers
+import atexit
 import re
 import yaml
 import threading
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 import queue
 import time
-import shutil
-from typing import List, Dict, Optional
-from openai import OpenAI
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logging.info("[MARKER] pyqt_latex2video.py loaded and running from: " + os.path.abspath(__file__))
-print("[PRINT-MARKER] pyqt_latex2video.py loaded and running from:", os.path.abspath(__file__))
+import asyncio
+import hashlib
+import json
+import tempfile
+from types import MappingProxyType
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+# Directory holding this script; default config, output, cache and log paths live under it
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_FILE_PATH = os.path.join(_SCRIPT_DIR, 'latex2video_gui.log')
+DEFAULT_CONFIG_PATH = os.path.join(_SCRIPT_DIR, 'config', 'config.yaml')
+# Set LATEX2VIDEO_DEBUG=1 to log the [PYQT_DEBUG]/[PRINT-DEBUG] traces
+_DEBUG = bool(os.environ.get('LATEX2VIDEO_DEBUG'))
+
+# Log to the console and to a file next to the script. Callers only enqueue records; a listener
+# thread does the formatting and writing, so a logging call never waits on console or disk I/O.
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(_log_formatter)
+_log_file_handler = logging.FileHandler(LOG_FILE_PATH)
+_log_file_handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler, _log_file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Only merge the arguments into the message here; timestamp and level are added by the listener's handlers
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.DEBUG if _DEBUG else logging.INFO, handlers=[_log_queue_handler])
+# Debug traces go through this logger; at the default INFO level their messages are never formatted
+logger = logging.getLogger(__name__)
+logging.info("[MARKER] pyqt_latex2video.py loaded and running from: " + os.path.join(_SCRIPT_DIR, os.path.basename(__file__)))
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QLineEdit, QTextEdit, QFileDialog, QMessageBox, QSplitter, QGridLayout,
+    QTabWidget, QLineEdit, QTextEdit, QPlainTextEdit, QFileDialog, QMessageBox, QSplitter, QGridLayout,
     QFrame, QStatusBar, QAction, QScrollArea
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject, QSettings, QTimer
-from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtCore import Qt, QThreadPool, QRunnable, pyqtSignal, QObject, QSettings, QTimer
+from PyQt5.QtGui import QIcon, QPixmap, QImage, QImageReader, QTextCursor
 
 # Add the parent directory to the path so we can import from src
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(_SCRIPT_DIR)
 
 from src.latex_parser import parse_latex_file, Slide
 from src.chatgpt_script_generator import format_slide_for_chatgpt, clean_chatgpt_response
-from src.openai_script_generator import initialize_openai_client, generate_script_with_openai
-from src.image_generator import generate_slide_images
-from src.audio_generator import generate_all_audio
-from src.simple_video_assembler import assemble_video
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'latex2video_gui.log'))
-    ]
+# The OpenAI SDK, pdf2image/PIL and the TTS backends are imported on first use to keep startup fast
+
+# Subdirectories created under every output directory
+OUTPUT_SUBDIRS = ('slides', 'audio', 'temp_pdf', 'chatgpt_prompts', 'chatgpt_responses')
+# Label-sized slide pixmaps kept for instant prev/next navigation
+SCALED_PIXMAP_CACHE_SIZE = 32
+# Quiet time after the last resize event before the smooth rescale; shorter fires it mid-drag on slow event streams
+RESIZE_SETTLE_MS = 200
+# Navigation: wait this long after a slide change before loading its image, and this long after showing a
+# fast-scaled image before smoothing it; the upgrade outlasts a key-repeat interval, so held keys never pay for it
+SLIDE_IMAGE_DELAY_MS = 30
+SMOOTH_UPGRADE_MS = 80
+
+_event_loop = None
+_event_loop_lock = threading.Lock()
+
+def background_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared asyncio loop that coroutine workers run on, starting it on first use.
+    
+    A single long-lived loop lets async clients (and their connection pools) be reused across runs.
+    """
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = asyncio.new_event_loop()
+            threading.Thread(target=_event_loop.run_forever, name='l2v-asyncio', daemon=True).start()
+        return _event_loop
+
+def fast_rmtree(path: str, keep=()):
+    """Delete the contents of a directory (not the directory itself) in one scandir pass per level.
+    
+    Top-level entries whose names are in keep are left alone.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name in keep:
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    fast_rmtree(entry.path)
+                    os.rmdir(entry.path)
+                else:
+                    os.unlink(entry.path)
+            except OSError as e:
+                logging.warning(f"Could not remove {entry.path}: {e}")
+
+def load_scaled_image(path: str, max_size=None) -> QImage:
+    """Decode an image no larger than max_size (a QSize), letting the codec scale while decoding"""
+    reader = QImageReader(path)
+    if max_size is not None:
+        size = reader.size()
+        if size.isValid() and (size.width() > max_size.width() or size.height() > max_size.height()):
+            reader.setScaledSize(size.scaled(max_size, Qt.KeepAspectRatio))
+    return reader.read()
+
+# io_uring batch reads for load_scripts when the optional liburing bindings are installed (Linux only)
+IO_URING_DEPTH = 256
+liburing = None
+if sys.platform == 'linux':
+    try:
+        import liburing
+    except ImportError:
+        pass
+
+RESPONSE_FILE_NAME = 'slide_{}_response.txt'
+PROMPT_FILE_NAME = 'slide_{}_prompt.txt'
+RESPONSE_FILE_RE = re.compile(r'slide_(\d+)_response\.txt')
+PROMPT_FILE_RE = re.compile(r'slide_(\d+)_prompt\.txt')
+# Snapshot of the last load_scripts result, kept in the output directory; plain JSON, never unpickled
+SCRIPTS_STATE_FILE = 'scripts_state.json'
+SLIDE_IMAGE_EXTS = ('png', 'jpg', 'jpeg')
+# Preference of each extension when a slide has several images, in the old probe order
+SLIDE_IMAGE_EXT_RANK = {ext: rank for rank, ext in enumerate(SLIDE_IMAGE_EXTS)}
+SLIDE_IMAGE_RE = re.compile(r'slide_(\d+)\.(png|jpg|jpeg)')
+AUDIO_FILE_RE = re.compile(r'audio_(\d+)\.mp3')
+# Per-slide outputs, by output subdirectory; files numbered past the loaded deck's last slide are stale
+SLIDE_OUTPUT_PATTERNS = (
+    ('slides', SLIDE_IMAGE_RE),
+    ('audio', AUDIO_FILE_RE),
+    ('chatgpt_prompts', PROMPT_FILE_RE),
+    ('chatgpt_responses', RESPONSE_FILE_RE),
 )
 
+def scan_slide_files(directory: str, pattern) -> Dict[int, os.DirEntry]:
+    """Map 1-based slide numbers to the matching files in directory, using a single scandir pass"""
+    entries = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            match = pattern.fullmatch(entry.name)
+            if match and entry.is_file():
+                entries[int(match.group(1))] = entry
+    return entries
+
+def prune_slide_outputs(output_dir: str, count: int) -> int:
+    """Delete per-slide output files numbered above count and return how many were removed"""
+    removed = 0
+    for sub, pattern in SLIDE_OUTPUT_PATTERNS:
+        try:
+            entries = scan_slide_files(os.path.join(output_dir, sub), pattern)
+        except OSError:
+            continue
+        for number, entry in entries.items():
+            if number > count:
+                try:
+                    os.unlink(entry.path)
+                    removed += 1
+                except OSError as e:
+                    logging.warning(f"Could not remove {entry.path}: {e}")
+    return removed
+
+def has_slide_file(directory: str, pattern) -> bool:
+    """True if directory holds at least one file matching pattern, stopping at the first hit"""
+    try:
+        with os.scandir(directory) as it:
+            return any(pattern.fullmatch(entry.name) and entry.is_file() for entry in it)
+    except OSError:
+        return False
+
+def scan_slide_images(directory: str) -> Dict[int, str]:
+    """Map 1-based slide numbers to image paths in one scandir pass.
+    
+    When a slide has several images the old probe order wins: png, jpg, jpeg, and slide_001 before slide_1.
+    """
+    best = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            match = SLIDE_IMAGE_RE.fullmatch(entry.name)
+            if not match or not entry.is_file():
+                continue
+            number = int(match.group(1))
+            rank = (SLIDE_IMAGE_EXT_RANK[match.group(2)], len(match.group(1)) != 3)
+            if number not in best or rank < best[number][0]:
+                best[number] = (rank, entry.path)
+    return {number: path for number, (rank, path) in best.items()}
+
+def read_text_file(path: str, size_hint: int = -1, strip: bool = False) -> str:
+    """Read a small UTF-8 text file whole through a raw fd, skipping the buffered/text IO layers.
+    
+    Newlines are normalized like text-mode open(); size_hint (e.g. from a scandir stat) saves a read call.
+    strip=True gives the same result as .strip() on the text, see decode_text.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        size = size_hint + 1 if size_hint >= 0 else 65536
+        while True:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return decode_text(b''.join(chunks), strip)
+
+def decode_text(data: bytes, strip: bool = False) -> str:
+    """Decode UTF-8 file contents with text-mode newline normalization, optionally stripped.
+    
+    Stripping the bytes before decoding avoids building the full str only to copy it; the str
+    strip afterwards only catches non-ASCII whitespace and returns the text itself otherwise.
+    """
+    if strip:
+        text = data.strip().decode('utf-8').strip()
+    else:
+        text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def read_text_files_uring(files: List[tuple], strip: bool = False) -> List[str]:
+    """Read many small text files with batched io_uring submissions (Linux, optional liburing package).
+    
+    files holds (path, size) pairs; each batch of reads costs one submit instead of one read() per file.
+    """
+    results = [None] * len(files)
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    liburing.io_uring_queue_init(IO_URING_DEPTH, ring)
+    try:
+        for batch_start in range(0, len(files), IO_URING_DEPTH):
+            batch = range(batch_start, min(batch_start + IO_URING_DEPTH, len(files)))
+            fds = {}
+            buffers = {}
+            try:
+                for i in batch:
+                    path, size = files[i]
+                    fds[i] = os.open(path, os.O_RDONLY)
+                    # One spare byte tells a file that grew since its stat apart from a complete read
+                    buffers[i] = bytearray(size + 1)
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_read(sqe, fds[i], buffers[i], 0)
+                    liburing.io_uring_sqe_set_data64(sqe, i)
+                liburing.io_uring_submit(ring)
+                # Reap every completion before raising: the kernel writes into these buffers until then
+                errors = []
+                for _ in fds:
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    completion = cqe[0]
+                    i = liburing.io_uring_cqe_get_data64(completion)
+                    res = completion.res
+                    liburing.io_uring_cqe_seen(ring, completion)
+                    if res < 0:
+                        errors.append(OSError(-res, os.strerror(-res), files[i][0]))
+                    elif res > files[i][1]:
+                        results[i] = read_text_file(files[i][0], strip=strip)
+                    else:
+                        results[i] = decode_text(bytes(memoryview(buffers[i])[:res]), strip)
+                if errors:
+                    raise errors[0]
+            finally:
+                for fd in fds.values():
+                    os.close(fd)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return results
+
+def scripts_signature(entries: Dict[int, os.DirEntry]) -> tuple:
+    """(slide, mtime, size) of every scanned script file; any edit, addition or removal changes it"""
+    signature = []
+    for number, entry in sorted(entries.items()):
+        st = entry.stat()
+        signature.append((number, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+def _json_signature(signature: tuple) -> list:
+    """A scripts signature the way it reads back from JSON, with its tuples as lists"""
+    num_slides, response_signature, prompt_signature = signature
+    return [num_slides, [list(e) for e in response_signature], [list(e) for e in prompt_signature]]
+
+def _valid_scripts_state(state) -> bool:
+    """True if a decoded snapshot has the shape save_scripts_state writes"""
+    if not isinstance(state, dict) or not isinstance(state.get('result'), dict):
+        return False
+    signature = state.get('signature')
+    if not isinstance(signature, list) or len(signature) != 3 or not isinstance(signature[0], int):
+        return False
+    for entries in signature[1:]:
+        if not isinstance(entries, list) or not all(
+                isinstance(e, list) and len(e) == 3 and all(isinstance(v, int) for v in e) for e in entries):
+            return False
+    for name in ('narrations', 'prompts'):
+        texts = state['result'].get(name)
+        if texts is None and name == 'prompts':
+            continue
+        if not isinstance(texts, list) or not all(t is None or isinstance(t, str) for t in texts):
+            return False
+    return True
+
+def load_scripts_state(path: str, signature: tuple) -> Optional[dict]:
+    """The load_scripts result saved in path, or None if it is missing, unreadable, malformed or its files changed"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"[LOAD_SCRIPTS] Ignoring unreadable {path}: {e}")
+        return None
+    if not _valid_scripts_state(state) or state['signature'] != _json_signature(signature):
+        return None
+    return state['result']
+
+def save_scripts_state(path: str, signature: tuple, result: dict):
+    """Atomically save a load_scripts result with the signature of the files it was read from"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'signature': signature, 'result': result}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def patch_scripts_state(path: str, written: Dict[int, tuple]):
+    """Fold rewritten response files into the load_scripts snapshot at path, so the next load still reads one file.
+    
+    written maps slide numbers to (text, os.stat_result) of the new files. The rest of the saved signature is
+    kept; if any other script file changed since the snapshot was taken, the next load still misses and rereads.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return
+    except ValueError as e:
+        state = None
+        logging.warning(f"[LOAD_SCRIPTS] Unreadable {path}: {e}")
+    if not _valid_scripts_state(state) or (
+            state['signature'][0] and len(state['result']['narrations']) != state['signature'][0]):
+        # Drop it rather than fail every save on it; the next load rebuilds it from the files
+        logging.warning(f"[LOAD_SCRIPTS] Removing malformed snapshot {path}")
+        os.unlink(path)
+        return
+    num_slides, response_signature, prompt_signature = state['signature']
+    narrations = list(state['result']['narrations'])
+    # Snapshots taken without parsed slides index narrations by file order, not slide number
+    if not num_slides or max(written) > num_slides:
+        return
+    responses = {number: (mtime, size) for number, mtime, size in response_signature}
+    for number, (text, st) in written.items():
+        responses[number] = (st.st_mtime_ns, st.st_size)
+        # What load_scripts would read back from the file
+        narrations[number - 1] = decode_text(text.encode('utf-8'), strip=True)
+    signature = (num_slides, tuple((number,) + responses[number] for number in sorted(responses)), prompt_signature)
+    save_scripts_state(path, signature, dict(state['result'], narrations=narrations))
+
+def write_text_files(items) -> List[os.stat_result]:
+    """Write (path, text) pairs as UTF-8 files through raw fds, skipping the buffered/text IO layers.
+    
+    Existing files are replaced; newlines are written as os.linesep, like text-mode open().
+    Returns the stat of each written file, in order.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    stats = []
+    for path, content in items:
+        if os.linesep != '\n':
+            content = content.replace('\n', os.linesep)
+        data = memoryview(content.encode('utf-8'))
+        fd = os.open(path, flags, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            stats.append(os.fstat(fd))
+        finally:
+            os.close(fd)
+    return stats
+
+def file_sha256(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents, hashed in fixed-size chunks"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def parse_pdf_signature(latex_file: str) -> Optional[tuple]:
+    """(path, mtime, size) of the PDF parse_latex_file takes the page count from, or None if there is none"""
+    base_name = os.path.splitext(os.path.basename(latex_file))[0]
+    # Same lookup order as parse_latex_file: next to the source, then output/temp_pdf
+    for pdf_path in (os.path.join(os.path.dirname(os.path.abspath(latex_file)), base_name + '.pdf'),
+                     os.path.join('output', 'temp_pdf', base_name + '.pdf')):
+        try:
+            st = os.stat(pdf_path)
+        except OSError:
+            continue
+        return (os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size)
+    return None
+
 class Worker(QObject):
-    """Worker thread for background tasks"""
+    """Background task; its signals are delivered to the GUI thread while run() executes on the thread pool"""
     finished = pyqtSignal()
     error = pyqtSignal(str)
     result = pyqtSignal(object)
-    progress = pyqtSignal(str)
 
     def __init__(self, fn, *args, **kwargs):
         super().__init__()
-        print("[PRINT-DEBUG] Worker.__init__ called")
+        logger.debug("[PRINT-DEBUG] Worker.__init__ called")
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
 
     def run(self):
         """Run the worker function"""
-        print("[PYQT_DEBUG] Worker.run: Entered (Restored Version).")
+        logger.debug("[PYQT_DEBUG] Worker.run: Entered (Restored Version).")
         try:
-            print(f"[PYQT_DEBUG] Worker.run: About to call self.fn: {self.fn.__name__ if hasattr(self.fn, '__name__') else 'unknown_fn'}")
+            logger.debug("[PYQT_DEBUG] Worker.run: About to call self.fn: %s", self.fn.__name__ if hasattr(self.fn, '__name__') else 'unknown_fn')
+            # Coroutine functions never get here: _start_worker schedules them with run_async
             result = self.fn(*self.args, **self.kwargs)
-            print(f"[PYQT_DEBUG] Worker.run: self.fn call completed. Result: {type(result)}")
+            logger.debug("[PYQT_DEBUG] Worker.run: self.fn call completed. Result: %s", type(result))
             self.result.emit(result)
-            print(f"[PYQT_DEBUG] Worker.run: self.result signal emitted.")
+            logger.debug("[PYQT_DEBUG] Worker.run: self.result signal emitted.")
         except Exception as e:
-            print(f"[PYQT_DEBUG] Worker.run: Exception caught: {e}")
-            # print(traceback.format_exc()) # Optional: for more detail in console
+            logger.debug("[PYQT_DEBUG] Worker.run: Exception caught: %s", e)
             self.error.emit(str(e))
-            print(f"[PYQT_DEBUG] Worker.run: self.error signal emitted.")
+            logger.debug("[PYQT_DEBUG] Worker.run: self.error signal emitted.")
             logging.error(f"Error in worker thread ({self.fn.__name__ if hasattr(self.fn, '__name__') else 'unknown_fn'}): {e}", exc_info=True)
         finally:
-            print("[PYQT_DEBUG] Worker.run: Emitting finished signal.")
+            logger.debug("[PYQT_DEBUG] Worker.run: Emitting finished signal.")
             self.finished.emit()
-            print("[PYQT_DEBUG] Worker.run: self.finished signal emitted. Exiting run method.")
+            logger.debug("[PYQT_DEBUG] Worker.run: self.finished signal emitted. Exiting run method.")
 
+    def run_async(self):
+        """Schedule a coroutine fn on the background loop without tying up a pool thread while it runs"""
+        future = asyncio.run_coroutine_threadsafe(self.fn(*self.args, **self.kwargs), background_event_loop())
+        future.add_done_callback(self._on_async_done)
 
-    def _generate_images_worker(self, latex_file):
-        """Worker function for generating images"""
+    def _on_async_done(self, future):
+        """Emit the result signals for a run_async coroutine; called on the loop thread"""
         try:
-            print("[PRINT-DEBUG] ENTERED _generate_images_worker")
-            # Add the LaTeX file path to the configuration
-            config_copy = self.config.copy()
-            config_copy['latex_file_path'] = os.path.abspath(latex_file)
-            print("[PRINT-DEBUG] About to call generate_slide_images in src.image_generator.py")
-            # Generate slide images
-            return generate_slide_images(latex_file, config_copy)
+            self.result.emit(future.result())
         except Exception as e:
-            print("[PRINT-DEBUG] Exception in _generate_images_worker:", e)
-            raise
+            self.error.emit(str(e))
+            logging.error(f"Error in worker coroutine ({getattr(self.fn, '__name__', 'unknown_fn')}): {e}", exc_info=True)
+        finally:
+            self.finished.emit()
+
+class WorkerRunnable(QRunnable):
+    """QRunnable that runs a Worker on a QThreadPool"""
+    def __init__(self, worker: Worker):
+        super().__init__()
+        self.worker = worker
+
+    def run(self):
+        self.worker.run()
 
 class RedirectText:
-    """Class to redirect stdout/stderr to a QTextEdit widget"""
+    """Class to redirect stdout/stderr to a QPlainTextEdit widget"""
     def __init__(self, text_widget):
         self.text_widget = text_widget
-        self.buffer = ""
+        # Writes may come from worker threads; buffer them and flush on the GUI thread at ~20 Hz
+        self._buf = []
+        self._lock = threading.Lock()
+        self._timer = QTimer(text_widget)
+        self._timer.timeout.connect(self._flush)
+        self._timer.start(50)
 
     def write(self, string):
-        self.buffer += string
-        self.text_widget.append(string)
+        with self._lock:
+            self._buf.append(string)
+
+    def _flush(self):
+        with self._lock:
+            if not self._buf:
+                return
+            chunk = ''.join(self._buf)
+            self._buf.clear()
+        # A burst larger than the block cap would be laid out only to be discarded; keep the tail
+        max_blocks = self.text_widget.document().maximumBlockCount()
+        if max_blocks > 0 and chunk.count('\n') >= max_blocks:
+            chunk = '\n'.join(chunk.split('\n')[-max_blocks:])
+        self.text_widget.moveCursor(QTextCursor.End)
+        self.text_widget.insertPlainText(chunk)
         self.text_widget.ensureCursorVisible()
 
     def flush(self):
@@ -117,7 +513,7 @@ QMainWindow, QWidget {
     background-color: #f0f0f0;
     color: #202020;
 }
-QTextEdit, QLineEdit {
+QTextEdit, QPlainTextEdit, QLineEdit {
     background-color: #ffffff;
     color: #202020;
     border: 1px solid #c0c0c0;
@@ -159,7 +555,7 @@ QMainWindow, QWidget {
     background-color: #2d2d2d;
     color: #e0e0e0;
 }
-QTextEdit, QLineEdit {
+QTextEdit, QPlainTextEdit, QLineEdit {
     background-color: #3d3d3d;
     color: #e0e0e0;
     border: 1px solid #505050;
@@ -198,9 +594,19 @@ QStatusBar {
 
 class LaTeX2VideoGUI(QMainWindow):
     """Main GUI application for LaTeX2Video using PyQt5"""
+    # Lets pool threads report progress; the queued connection delivers it on the GUI thread
+    status_requested = pyqtSignal(str)
+    # (path, mtime, QImage) decoded and scaled on the pool, turned into a QPixmap on the GUI thread
+    pixmap_prewarmed = pyqtSignal(str, float, object)
+    # (navigation token, path, mtime, label size, QImage) for a first-visit slide decoded on the pool
+    slide_image_decoded = pyqtSignal(int, str, float, object, object)
+
     def __init__(self):
         super().__init__()
         
+        # Shared pool for independent I/O-bound units of work (e.g. per-slide conversions)
+        self.pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix='l2v')
+        
         # Initialize variables
         self.latex_file_path = ""
         self.config_file_path = ""
@@ -209,21 +615,75 @@ class LaTeX2VideoGUI(QMainWindow):
         self.slides = []
         self.narrations = []
         self.prompts = []
+        # Response/prompt file paths per slide, rebuilt only when the output dir or slide count changes
+        self._script_paths_key = None
+        self._narration_paths: List[str] = []
+        self._prompt_paths: List[str] = []
+        # Response path -> (text, st_mtime_ns) as last written by save_scripts, to skip unchanged rewrites
+        self._saved_narrations: Dict[str, tuple] = {}
+        # Saves run on worker threads; held for a whole save so two never interleave their writes
+        self._save_lock = threading.Lock()
+        # True once self.prompts reflects the prompts directory, so navigation stops probing it
+        self._prompts_loaded = False
         self.config = {}
-        self.threads = []
+        # Read-only view of self.config handed to workers instead of a fresh copy per run
+        self._config_view = MappingProxyType(self.config)
+        self._config_cache: Dict[str, tuple] = {}
+        self._ensured_dirs: set = set()
+        # Workers running on the global QThreadPool, kept referenced until they finish
+        self._active_workers: set = set()
         self.dark_mode = False
+        self._tts_provider = None
+        self._tts_provider_key = None
+        # Threads for the blocking TTS calls, kept across runs and apart from the pools the other stages use
+        self._audio_exec: Optional[ThreadPoolExecutor] = None
+        self._audio_exec_workers = 0
+        self._async_openai_client: Optional['AsyncOpenAI'] = None
+        self._async_openai_key = None
+        self.current_image_path = None
+        # Largest decoded pixmap of the current slide, rescaled while a resize is in progress
+        self._original_pixmap: Optional[QPixmap] = None
+        # Decoded slide pixmaps keyed by path, stored with the file mtime so regenerated slides are reloaded
+        self._pix_cache: Dict[str, tuple] = {}
+        # LRU of smooth-scaled pixmaps keyed by path, stored with the file mtime and the label size they fit
+        self._scaled_pix_cache: OrderedDict = OrderedDict()
+        # Slide number -> image path for the slides directory; None until scanned, reset when images change
+        self._slide_image_index: Optional[Dict[int, str]] = None
+        # Bumped on every load_slide_image; pool decodes that finish after the user moved on are not shown
+        self._nav_token = 0
         
         # Set default paths
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.config_file_path = os.path.join(script_dir, "config", "config.yaml")
-        self.output_dir = os.path.join(script_dir, "output")
+        self.config_file_path = DEFAULT_CONFIG_PATH
+        self.output_dir = os.path.join(_SCRIPT_DIR, "output")
+        
+        # On-disk cache of parsed slides and formatted prompts, keyed by the LaTeX file hash
+        self._cache_dir = os.path.join(_SCRIPT_DIR, '.cache')
+        # OpenAI responses keyed by model, sampling settings and prompt (shared with the CLI generator)
+        self._llm_cache_dir = os.path.join(self._cache_dir, 'llm')
+        # Synthesized narrations keyed by TTS provider, voice settings and text (src.audio_cache.AUDIO_CACHE_DIR)
+        self._tts_cache_dir = os.path.join(self._cache_dir, 'tts')
+        self._latex_hash = None
+        # (path, mtime_ns, size) of the source behind self.slides; lets a repeat parse skip hashing
+        self._parse_key = None
         
         # Load settings
         self.settings = QSettings("LaTeX2Video", "PyQt5GUI")
         self.dark_mode = self.settings.value("dark_mode", False, type=bool)
         
+        # Debounce resizes: scale fast while dragging, smooth once the size settles
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._do_rescale)
+        # Rapid slide navigation only loads the image of the slide it settles on
+        self._slide_image_timer = QTimer(self)
+        self._slide_image_timer.setSingleShot(True)
+        self._slide_image_timer.timeout.connect(self.load_slide_image)
+        
         # Set up the UI
         self.init_ui()
+        self.status_requested.connect(self.update_status)
+        self.pixmap_prewarmed.connect(self._store_prewarmed)
+        self.slide_image_decoded.connect(self._show_decoded_slide_image)
         
         # Apply the appropriate theme
         self.apply_theme()
@@ -238,15 +698,15 @@ class LaTeX2VideoGUI(QMainWindow):
         # This is a test to see if it affects threading issues.
         if self.config.get('tts', {}).get('provider', '').lower() == 'gtts':
             try:
-                print("[PYQT_DEBUG] __init__: Attempting to pre-initialize GTTSProvider in main thread...")
+                logger.debug("[PYQT_DEBUG] __init__: Attempting to pre-initialize GTTSProvider in main thread...")
                 from src.tts_provider import GTTSProvider as MainThreadGTTSProvider # Alias to avoid confusion
                 # Use language from config or default
                 lang = self.config.get('tts', {}).get('language', 'pt')
                 slow_mode = self.config.get('tts', {}).get('slow', False)
                 _ = MainThreadGTTSProvider(language=lang, slow=slow_mode) # Create and discard
-                print(f"[PYQT_DEBUG] __init__: GTTSProvider pre-initialized successfully in main thread with lang='{lang}'.")
+                logger.debug("[PYQT_DEBUG] __init__: GTTSProvider pre-initialized successfully in main thread with lang='%s'.", lang)
             except Exception as e_main_gtts_init:
-                print(f"[PYQT_DEBUG] __init__: Failed to pre-initialize GTTSProvider in main thread: {e_main_gtts_init}")
+                logger.debug("[PYQT_DEBUG] __init__: Failed to pre-initialize GTTSProvider in main thread: %s", e_main_gtts_init)
                 # Log this error as well
                 logging.error(f"Failed to pre-initialize GTTSProvider in main thread: {e_main_gtts_init}", exc_info=True)
 
@@ -267,6 +727,17 @@ class LaTeX2VideoGUI(QMainWindow):
         self.dark_mode_action.triggered.connect(self.toggle_dark_mode)
         view_menu.addAction(self.dark_mode_action)
         
+        tools_menu = menubar.addMenu("Tools")
+        clear_llm_cache_action = QAction("Clear LLM Cache", self)
+        clear_llm_cache_action.triggered.connect(self.clear_llm_cache)
+        tools_menu.addAction(clear_llm_cache_action)
+        clear_tts_cache_action = QAction("Clear TTS Cache", self)
+        clear_tts_cache_action.triggered.connect(self.clear_tts_cache)
+        tools_menu.addAction(clear_tts_cache_action)
+        clear_outputs_action = QAction("Clear Outputs", self)
+        clear_outputs_action.triggered.connect(self.clear_outputs)
+        tools_menu.addAction(clear_outputs_action)
+        
         # Create central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -456,8 +927,12 @@ class LaTeX2VideoGUI(QMainWindow):
         
         # Create log output
         generation_layout.addWidget(QLabel("Log Output:"))
-        self.log_text = QTextEdit()
+        # Plain-text, line-based layout: appending a block doesn't reflow the whole document
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        # Keep only the most recent lines so long runs don't grow memory without bound
+        self.log_text.setMaximumBlockCount(5000)
         generation_layout.addWidget(self.log_text)
         
         # Add generation tab to tab widget
@@ -498,33 +973,243 @@ class LaTeX2VideoGUI(QMainWindow):
         mode_name = "dark" if self.dark_mode else "light"
         self.update_status(f"Switched to {mode_name} mode")
 
+    def clear_llm_cache(self):
+        """Delete all cached OpenAI responses"""
+        if os.path.isdir(self._llm_cache_dir):
+            fast_rmtree(self._llm_cache_dir)
+        self.update_status("LLM response cache cleared")
+
+    def clear_tts_cache(self):
+        """Delete all cached narration audio"""
+        if os.path.isdir(self._tts_cache_dir):
+            fast_rmtree(self._tts_cache_dir)
+        self.update_status("TTS audio cache cleared")
+
     def update_status(self, message):
         """Update the status bar with a message"""
         self.status_bar.showMessage(message)
         logging.info(message)
 
+    @property
+    def async_openai_client(self) -> Optional['AsyncOpenAI']:
+        """Lazily created AsyncOpenAI client, rebuilt only when the API key changes"""
+        api_key = self.config.get('openai', {}).get('api_key')
+        if self._async_openai_client is None or self._async_openai_key != api_key:
+            import httpx
+            import importlib.util
+            from src.openai_script_generator import initialize_async_openai_client
+            self._close_async_openai_client()
+            # With h2 installed (httpx[http2]) concurrent slide requests share one multiplexed connection.
+            # Without a key the initializer only logs the error, so no pool is opened for it to leak.
+            http_client = httpx.AsyncClient(
+                http2=importlib.util.find_spec('h2') is not None,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=60
+            ) if api_key else None
+            self._async_openai_client = initialize_async_openai_client(self.config, http_client=http_client)
+            if self._async_openai_client is None and http_client is not None:
+                # The client was never built, so nothing else will close its connection pool
+                asyncio.run_coroutine_threadsafe(http_client.aclose(), background_event_loop())
+            self._async_openai_key = api_key
+        return self._async_openai_client
+
+    def _close_async_openai_client(self):
+        """Close the persistent AsyncOpenAI client on the loop it was used on"""
+        if self._async_openai_client is not None:
+            client, self._async_openai_client = self._async_openai_client, None
+            future = asyncio.run_coroutine_threadsafe(client.close(), background_event_loop())
+            try:
+                future.result(timeout=5)
+            except Exception as e:
+                logging.warning(f"Error closing OpenAI client: {e}")
+
+    def _script_paths(self, count: int):
+        """Response and prompt file paths for slides 1..count, built once per output dir and slide count"""
+        key = (self.output_dir, count)
+        if self._script_paths_key != key:
+            responses_dir = os.path.join(self.output_dir, 'chatgpt_responses')
+            prompts_dir = os.path.join(self.output_dir, 'chatgpt_prompts')
+            self._narration_paths = [os.path.join(responses_dir, RESPONSE_FILE_NAME.format(i + 1)) for i in range(count)]
+            self._prompt_paths = [os.path.join(prompts_dir, PROMPT_FILE_NAME.format(i + 1)) for i in range(count)]
+            self._script_paths_key = key
+        return self._narration_paths, self._prompt_paths
+
+    def _ensure_dirs(self, base: str):
+        """Create the output directory tree once per base directory"""
+        # Keyed by real path so a relative or symlinked spelling of the same directory is not redone
+        key = os.path.realpath(base)
+        if key in self._ensured_dirs:
+            return
+        for sub in OUTPUT_SUBDIRS:
+            os.makedirs(os.path.join(base, sub), exist_ok=True)
+        self._ensured_dirs.add(key)
+
+    def _submit(self, fn, *args, **kwargs) -> Future:
+        """Submit a task to the shared thread pool"""
+        return self.pool.submit(fn, *args, **kwargs)
+
+    def _start_worker(self, worker: Worker):
+        """Run a Worker on the global QThreadPool instead of a dedicated QThread"""
+        self._active_workers.add(worker)
+        worker.finished.connect(lambda: self._active_workers.discard(worker))
+        worker.finished.connect(worker.deleteLater)
+        if asyncio.iscoroutinefunction(worker.fn):
+            # Coroutines already run on the background loop; a pool thread would only block waiting for them
+            worker.run_async()
+        else:
+            QThreadPool.globalInstance().start(WorkerRunnable(worker))
+
     def resizeEvent(self, event):
         """Handle window resize event"""
         super().resizeEvent(event)
-        
-        # If we have a current image, reload it to fit the new size
-        if hasattr(self, 'current_image_path') and self.current_image_path:
-            try:
-                # Load the image
-                pixmap = QPixmap(self.current_image_path)
+        if event.size() == event.oldSize() or not self.current_image_path:
+            return
+
+        # Cheap rescale of the cached pixmap now, smooth rescale when resizing stops
+        self._do_rescale(Qt.FastTransformation)
+        self._resize_timer.start(RESIZE_SETTLE_MS)
+
+    def _do_rescale(self, transformation=Qt.SmoothTransformation):
+        """Rescale the cached current slide image to fit the label"""
+        if not self.current_image_path:
+            return
+        try:
+            if transformation == Qt.SmoothTransformation:
+                pixmap = self._scaled_pixmap(self.current_image_path)
+            else:
+                # Mid-drag: no stat or cache lookup, just rescale what is on screen already
+                pixmap = self._original_pixmap
+                if pixmap is None:
+                    pixmap = self._cached_pixmap(self.current_image_path)
                 if not pixmap.isNull():
-                    # Scale the image to fit the label while maintaining aspect ratio
+                    # With the aspect ratio kept, growing the slack dimension leaves the image size as is
+                    shown = self.slide_image_label.pixmap()
+                    target = pixmap.size().scaled(self.slide_image_label.size(), Qt.KeepAspectRatio)
+                    if shown is not None and shown.size() == target:
+                        return
                     pixmap = pixmap.scaled(
-                        self.slide_image_label.width(), 
+                        self.slide_image_label.width(),
                         self.slide_image_label.height(),
-                        Qt.KeepAspectRatio, 
-                        Qt.SmoothTransformation
+                        Qt.KeepAspectRatio,
+                        transformation
                     )
-                    
-                    # Display the image
-                    self.slide_image_label.setPixmap(pixmap)
-            except Exception as e:
-                logging.error(f"Error resizing image: {e}")
+            if not pixmap.isNull():
+                self.slide_image_label.setPixmap(pixmap)
+        except Exception as e:
+            logging.error(f"Error resizing image: {e}")
+
+    def _preview_max_size(self):
+        """Largest size a cached slide pixmap needs: the available screen area"""
+        screen = QApplication.primaryScreen()
+        return screen.availableGeometry().size() if screen is not None else None
+
+    def _cached_pixmap(self, path: str) -> QPixmap:
+        """Decode a slide image once and keep a copy no larger than the screen"""
+        path = os.path.abspath(path)
+        mtime = os.path.getmtime(path)
+        cached = self._pix_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        # 300 dpi slides are far larger than any label; decode straight to screen size so later rescales touch fewer bytes
+        pixmap = QPixmap.fromImage(load_scaled_image(path, self._preview_max_size()))
+        if not pixmap.isNull():
+            self._pix_cache[path] = (mtime, pixmap)
+        return pixmap
+
+    def _memoized_scaled_pixmap(self, path: str) -> Optional[QPixmap]:
+        """The smooth label-sized pixmap for path if it is already in the LRU, else None"""
+        path = os.path.abspath(path)
+        cached = self._scaled_pix_cache.get(path)
+        if cached and cached[1] == self._label_size() and cached[0] == os.path.getmtime(path):
+            self._scaled_pix_cache.move_to_end(path)
+            return cached[2]
+        return None
+
+    def _label_size(self):
+        """Current slide label size as a (width, height) tuple"""
+        return (self.slide_image_label.width(), self.slide_image_label.height())
+
+    def _scaled_pixmap(self, path: str) -> QPixmap:
+        """Smooth-scale a slide image to the label, memoized so revisiting a slide skips the resample"""
+        memoized = self._memoized_scaled_pixmap(path)
+        if memoized is not None:
+            return memoized
+        path = os.path.abspath(path)
+        size = self._label_size()
+        mtime = os.path.getmtime(path)
+        pixmap = self._cached_pixmap(path)
+        if pixmap.isNull():
+            return pixmap
+        pixmap = pixmap.scaled(size[0], size[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self._remember_scaled_pixmap(path, size, mtime, pixmap)
+        return pixmap
+
+    def _decode_slide_image(self, token: int, path: str, label_size, max_size):
+        """Decode a slide image on the pool once, at most max_size, for both the label and the prewarm cache
+        
+        The label-size copy is emitted first so it reaches the screen before the cache entry.
+        """
+        try:
+            mtime = os.path.getmtime(path)
+            image = load_scaled_image(path, max_size)
+            if image.isNull():
+                logging.error(f'Error loading image {path}')
+                return
+            shown = image.scaled(label_size[0], label_size[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            self.slide_image_decoded.emit(token, path, mtime, label_size, shown)
+            self.pixmap_prewarmed.emit(path, mtime, image)
+        except Exception as e:
+            logging.error(f'Error loading image {path}: {e}')
+
+    def _show_decoded_slide_image(self, token: int, path: str, mtime: float, size, image):
+        """Memoize a slide decoded by _decode_slide_image and show it if the user is still on that slide (GUI thread only)"""
+        pixmap = QPixmap.fromImage(image)
+        self._remember_scaled_pixmap(path, size, mtime, pixmap)
+        if token != self._nav_token:
+            return
+        self._show_slide_pixmap(path, pixmap)
+        if size != self._label_size():
+            # The label was resized while decoding
+            self._resize_timer.start(SMOOTH_UPGRADE_MS)
+
+    def _show_slide_pixmap(self, path: str, pixmap: QPixmap):
+        """Put a label-sized slide pixmap on screen and remember its source for rescaling"""
+        self.current_image_path = path
+        cached = self._pix_cache.get(path)
+        self._original_pixmap = cached[1] if cached else pixmap
+        self.slide_image_label.setPixmap(pixmap)
+        self.slide_image_label.setText('')
+        self.update_status(f'Loaded slide image: {path}')
+
+    def _remember_scaled_pixmap(self, path: str, size, mtime: float, pixmap: QPixmap):
+        """Insert a label-sized pixmap into the LRU, evicting the least recently used one.
+        
+        Entries are per path, so a rescale after a resize replaces the slide's old size instead of taking another slot.
+        """
+        self._scaled_pix_cache[path] = (mtime, size, pixmap)
+        self._scaled_pix_cache.move_to_end(path)
+        if len(self._scaled_pix_cache) > SCALED_PIXMAP_CACHE_SIZE:
+            self._scaled_pix_cache.popitem(last=False)
+
+    def _prewarm(self, path: str, size):
+        """Decode and shrink a slide image on the pool; QImage is safe to use off the GUI thread"""
+        try:
+            path = os.path.abspath(path)
+            mtime = os.path.getmtime(path)
+            image = load_scaled_image(path, size)
+            if image.isNull():
+                return
+            self.pixmap_prewarmed.emit(path, mtime, image)
+        except Exception as e:
+            logging.warning(f"Error prewarming slide image {path}: {e}")
+
+    def _store_prewarmed(self, path: str, mtime: float, image):
+        """Cache a prewarmed slide image as a QPixmap (GUI thread only)"""
+        cached = self._pix_cache.get(path)
+        if not cached or cached[0] != mtime:
+            self._pix_cache[path] = (mtime, QPixmap.fromImage(image))
+            if self.current_image_path and os.path.abspath(self.current_image_path) == path:
+                self._original_pixmap = self._pix_cache[path][1]
     
     def closeEvent(self, event):
         """Handle window close event"""
@@ -532,6 +1217,13 @@ class LaTeX2VideoGUI(QMainWindow):
         sys.stdout = sys.__stdout__
         sys.stderr = sys.__stderr__
         
+        # Drop queued pool work (both pools); running tasks finish in the background
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        if self._audio_exec is not None:
+            self._audio_exec.shutdown(wait=False, cancel_futures=True)
+        QThreadPool.globalInstance().clear()
+        self._close_async_openai_client()
+        
         # Accept the close event
         event.accept()
 
@@ -544,20 +1236,39 @@ class LaTeX2VideoGUI(QMainWindow):
             "LaTeX Files (*.tex);;All Files (*.*)"
         )
         if file_path:
-            # Clean output directories when a new LaTeX file is loaded
-            for outdir in ["output", "output-lagrange", "output-test"]:
-                abs_outdir = os.path.join(os.path.dirname(os.path.abspath(__file__)), outdir)
-                if os.path.exists(abs_outdir):
-                    shutil.rmtree(abs_outdir)
-                os.makedirs(abs_outdir, exist_ok=True)
             self.latex_file_path = file_path
             self.latex_file_edit.setText(file_path)
             self.update_status(f"LaTeX file selected: {file_path}")
             # Automatically parse LaTeX and generate slides after loading
             self.parse_latex()
+            # Existing outputs are overwritten file by file; only those past the new deck's end are dropped
+            if self.slides:
+                removed = prune_slide_outputs(self.output_dir, len(self.slides))
+                if removed:
+                    logging.info(f"Removed {removed} output files beyond slide {len(self.slides)}")
+                    self._slide_image_index = None
             # Automatically generate images after parsing LaTeX
             self.generate_images()
 
+    def clear_outputs(self):
+        """Delete everything under the output directory after asking for confirmation"""
+        reply = QMessageBox.question(
+            self, "Clear Outputs",
+            f"Delete all generated files in {self.output_dir}?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        if os.path.isdir(self.output_dir):
+            fast_rmtree(self.output_dir)
+        self._ensured_dirs.clear()
+        self._ensure_dirs(self.output_dir)
+        self._slide_image_index = None
+        self._scaled_pix_cache.clear()
+        if self.slides:
+            self.update_slide_display()
+        self.update_status(f"Cleared outputs in {self.output_dir}")
+
     def browse_config_file(self):
         """Open file dialog to select config file"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -581,16 +1292,12 @@ class LaTeX2VideoGUI(QMainWindow):
         )
         if dir_path:
             self.output_dir = dir_path
+            self._slide_image_index = None
             self.output_dir_edit.setText(dir_path)
             self.config['output_dir'] = dir_path
             
             # Ensure output directories exist
-            os.makedirs(dir_path, exist_ok=True)
-            os.makedirs(os.path.join(dir_path, 'slides'), exist_ok=True)
-            os.makedirs(os.path.join(dir_path, 'audio'), exist_ok=True)
-            os.makedirs(os.path.join(dir_path, 'temp_pdf'), exist_ok=True)
-            os.makedirs(os.path.join(dir_path, 'chatgpt_prompts'), exist_ok=True)
-            os.makedirs(os.path.join(dir_path, 'chatgpt_responses'), exist_ok=True)
+            self._ensure_dirs(dir_path)
             
             self.update_status(f"Output directory selected: {dir_path}")
 
@@ -599,20 +1306,23 @@ class LaTeX2VideoGUI(QMainWindow):
         config_path = self.config_file_path
         if os.path.exists(config_path):
             try:
-                with open(config_path, 'r') as f:
-                    self.config = yaml.safe_load(f)
-                logging.info(f"Configuration loaded from {config_path}")
+                # Reparse only when the file has changed since it was last loaded
+                mtime = os.stat(config_path).st_mtime_ns
+                cached = self._config_cache.get(config_path)
+                if cached and cached[0] == mtime:
+                    self.config = cached[1]
+                else:
+                    with open(config_path, 'rb') as f:
+                        self.config = yaml.load(f, Loader=SafeLoader)
+                    self._config_cache[config_path] = (mtime, self.config)
+                    logging.info(f"Configuration loaded from {config_path}")
                 
                 # Add output_dir to config
                 self.config['output_dir'] = self.output_dir
+                self._config_view = MappingProxyType(self.config)
                 
                 # Ensure output directories exist
-                os.makedirs(self.output_dir, exist_ok=True)
-                os.makedirs(os.path.join(self.output_dir, 'slides'), exist_ok=True)
-                os.makedirs(os.path.join(self.output_dir, 'audio'), exist_ok=True)
-                os.makedirs(os.path.join(self.output_dir, 'temp_pdf'), exist_ok=True)
-                os.makedirs(os.path.join(self.output_dir, 'chatgpt_prompts'), exist_ok=True)
-                os.makedirs(os.path.join(self.output_dir, 'chatgpt_responses'), exist_ok=True)
+                self._ensure_dirs(self.output_dir)
                 
                 return True
             except Exception as e:
@@ -637,8 +1347,17 @@ class LaTeX2VideoGUI(QMainWindow):
         self.update_status("Parsing LaTeX file...")
         
         try:
-            # Parse LaTeX file
-            self.slides = parse_latex_file(latex_file)
+            # Parse LaTeX file, reusing the cached result for unchanged sources and PDF
+            st = os.stat(latex_file)
+            parse_key = (os.path.abspath(latex_file), st.st_mtime_ns, st.st_size, parse_pdf_signature(latex_file))
+            if parse_key == self._parse_key and self.slides:
+                logging.info(f"LaTeX file unchanged since last parse, reusing {len(self.slides)} slides")
+            else:
+                self._parse_key = None
+                self._latex_hash = file_sha256(latex_file)
+                self.slides = self._load_parsed_slides(latex_file, parse_key[3])
+                if self.slides:
+                    self._parse_key = parse_key
             
             if not self.slides:
                 QMessageBox.critical(self, "Error", "Failed to parse slides from LaTeX file.")
@@ -648,13 +1367,14 @@ class LaTeX2VideoGUI(QMainWindow):
             # Initialize narrations list with empty strings
             self.narrations = [""] * len(self.slides)
             self.prompts = [""] * len(self.slides) # Initialize prompts list
+            self._prompts_loaded = False
+            self._script_paths(len(self.slides))
             
             # Update UI
             self.current_slide_index = 0
             self.update_slide_display()
             
-            self.update_status(f"Successfully parsed {len(self.slides)} slides.")
-            QMessageBox.information(self, "Success", f"Successfully parsed {len(self.slides)} slides.")
+            self.update_status(f"Successfully parsed {len(self.slides)} slides ({os.path.getsize(latex_file) / 1024:.1f} KB source).")
 
             # Copy generated PDF to output/temp_pdf
             try:
@@ -663,8 +1383,9 @@ class LaTeX2VideoGUI(QMainWindow):
                 dest_dir = os.path.join(self.output_dir, "temp_pdf")
                 dest_pdf = os.path.join(dest_dir, f"{base_name}.pdf")
                 if os.path.exists(src_pdf):
-                    os.makedirs(dest_dir, exist_ok=True)
-                    shutil.copy2(src_pdf, dest_pdf)
+                    self._ensure_dirs(self.output_dir)
+                    from src.image_generator import copy_if_changed
+                    copy_if_changed(src_pdf, dest_pdf)
                     logging.info(f"[PARSE_LATEX] Copied PDF from {src_pdf} to {dest_pdf}")
                 else:
                     logging.warning(f"[PARSE_LATEX] PDF not found to copy: {src_pdf}")
@@ -675,91 +1396,165 @@ class LaTeX2VideoGUI(QMainWindow):
             logging.error(f"Error parsing LaTeX file: {e}")
             QMessageBox.critical(self, "Error", f"Failed to parse LaTeX file: {e}")
 
-    def _generate_scripts_worker(self, client):
-        """Worker function for generating scripts with OpenAI API"""
+    def _load_parsed_slides(self, latex_file, pdf_signature):
+        """Return the slides for latex_file from the on-disk parse cache, parsing and caching on a miss
+        
+        The cache is keyed by the LaTeX hash and the signature of the PDF the page count comes from.
+        """
+        key = hashlib.sha256(f"{self._latex_hash}\0{pdf_signature!r}".encode('utf-8')).hexdigest()
+        cache_path = os.path.join(self._cache_dir, f"parse_{key}.json")
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                slides = [Slide(frame_number, title, content) for frame_number, title, content in json.load(f)]
+            if not all(isinstance(s.frame_number, int) and isinstance(s.title, str) and isinstance(s.content, str)
+                       for s in slides):
+                raise ValueError("unexpected entry types")
+            logging.info(f"Loaded parsed slides from cache: {cache_path}")
+            return slides
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # A corrupt or wrongly shaped entry is just a miss
+            logging.warning(f"[PARSE_LATEX] Discarding unreadable parse cache {cache_path}: {e}")
+            try:
+                os.unlink(cache_path)
+            except OSError:
+                pass
+        slides = parse_latex_file(latex_file)
+        if slides:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump([[s.frame_number, s.title, s.content] for s in slides], f, ensure_ascii=False)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        return slides
+
+    def _format_prompt(self, slide, index):
+        """Format a slide prompt, using the cache keyed by (LaTeX hash, slide index) when possible"""
+        if not self._latex_hash:
+            return format_slide_for_chatgpt(slide, self.slides, index)
+        
+        cache_path = os.path.join(self._cache_dir, f"prompt_{self._latex_hash}_{index}.txt")
+        if os.path.exists(cache_path):
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        
+        prompt = format_slide_for_chatgpt(slide, self.slides, index)
+        os.makedirs(self._cache_dir, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            f.write(prompt)
+        return prompt
+
+    def _format_prompts(self):
+        """Format the prompt of every slide; a slide that fails gets its exception in place of the prompt"""
+        prompts = [None] * len(self.slides)
+        for i, slide in enumerate(self.slides):
+            try:
+                prompts[i] = self._format_prompt(slide, i)
+            except Exception as slide_error:
+                logging.error(f"Error processing slide {i+1}: {str(slide_error)}")
+                prompts[i] = slide_error
+        return prompts
+
+    def _write_prompt_files(self, output_dir, items):
+        """Create the output tree under output_dir and write the (path, prompt) pairs"""
+        self._ensure_dirs(output_dir)
+        return write_text_files(items)
+
+    async def _generate_scripts_worker(self, client):
+        """Worker coroutine for generating scripts with OpenAI API.
+        
+        All slides are sent concurrently, bounded by openai.concurrency in the config.
+        """
+        from src.openai_script_generator import (generate_script_with_openai_async, llm_cache_path, store_llm_response,
+                                                 openai_concurrency)
         try:
-            print("[PRINT-DEBUG] _generate_scripts_worker: INICIOU")
+            logger.debug("[PRINT-DEBUG] _generate_scripts_worker: INICIOU")
             logging.info("========== SCRIPT GENERATION STARTED ==========")
-            logging.info(f"Worker thread ID: {threading.get_ident()}")
-            print(f"[PRINT-DEBUG] _generate_scripts_worker: slides={len(self.slides)} client={client} config={self.config}")
-            narrations = []
-            prompts = []
+            num_slides = len(self.slides)
+            concurrency = openai_concurrency(self.config)
             
-            # Add more detailed logging
-            logging.info(f"Starting to generate scripts for {len(self.slides)} slides")
-            logging.info(f"OpenAI client initialized: {client is not None}")
-            logging.info(f"OpenAI client type: {type(client)}")
-            logging.info(f"Using model: {self.config.get('openai', {}).get('model', 'gpt-4o')}")
-            logging.info(f"Config contents: {self.config}")
+            logging.info(f"Starting to generate scripts for {num_slides} slides "
+                         f"(model: {self.config.get('openai', {}).get('model', 'gpt-4o')}, concurrent requests: {concurrency})")
             
-            for i, slide in enumerate(self.slides):
+            # Format all slides up front; the prompt cache is on disk, so this runs on the pool, not the loop thread
+            prompts = await asyncio.wrap_future(self._submit(self._format_prompts))
+            
+            # Write all prompt files in one pool task while the API calls are in flight
+            _, prompt_paths = self._script_paths(num_slides)
+            prompt_writes = self._submit(self._write_prompt_files, self.output_dir, [
+                (prompt_paths[i], prompt) for i, prompt in enumerate(prompts) if isinstance(prompt, str) and prompt
+            ])
+            
+            semaphore = asyncio.Semaphore(concurrency)
+            report_every = max(1, num_slides // 20)
+            
+            cache_hits = 0
+            done = 0
+            cache_writes = []
+            
+            async def generate_one(i, prompt):
+                nonlocal cache_hits, done
+                if isinstance(prompt, Exception):
+                    raise prompt
+                
+                cache_path = llm_cache_path(self._llm_cache_dir, prompt, self.config)
                 try:
-                    print(f"[PRINT-DEBUG] _generate_scripts_worker: slide {i+1}/{len(self.slides)}")
-                    # Format slide for script generation
-                    formatted_content = format_slide_for_chatgpt(slide, self.slides, i)
-                    print(f"[PRINT-DEBUG] _generate_scripts_worker: formatted_content for slide {i+1} gerado")
-                    
-                    # Store the prompt
-                    prompts.append(formatted_content)
-                    
-                    # Log the prompt being sent (first 100 chars)
-                    prompt_preview = formatted_content[:100] + "..." if len(formatted_content) > 100 else formatted_content
-                    logging.info(f"Sending prompt for slide {i+1}: {prompt_preview}")
-                    
-                    # Generate script with OpenAI
-                    status_msg = f"Generating script for slide {i+1}/{len(self.slides)}: {slide.title}"
-                    logging.info(status_msg)
-                    
-                    # More detailed logging before API call
-                    logging.info(f"Calling OpenAI API for slide {i+1}")
-                    logging.info(f"OpenAI client: {client}")
-                    logging.info(f"OpenAI config: {self.config.get('openai', {})}")
-                    
-                    try:
-                        print(f"[PRINT-DEBUG] _generate_scripts_worker: About to call generate_script_with_openai for slide {i+1}")
-                        logging.info("About to call generate_script_with_openai")
-                        script = generate_script_with_openai(client, formatted_content, self.config)
-                        print(f"[PRINT-DEBUG] _generate_scripts_worker: generate_script_with_openai returned for slide {i+1}")
-                        logging.info(f"OpenAI API call completed. Response received: {bool(script)}")
-                    except Exception as api_error:
-                        print(f"[PRINT-DEBUG] _generate_scripts_worker: Exception in generate_script_with_openai for slide {i+1}: {api_error}")
-                        logging.error(f"Error calling OpenAI API: {api_error}")
-                        logging.error(f"Error details: {str(api_error)}")
-                        script = None
-                    
+                    script = await asyncio.wrap_future(self._submit(read_text_file, cache_path))
+                    cache_hits += 1
+                except FileNotFoundError:
+                    script = None
+                if script is None:
+                    async with semaphore:
+                        if _DEBUG:
+                            logging.debug(f"Generating script for slide {i+1}/{num_slides}: {self.slides[i].title}")
+                        script = await generate_script_with_openai_async(client, prompt, self.config)
+                    # Failed requests return "" and are not cached, so they are retried next run.
+                    # The cache write goes to the pool so the event loop keeps serving the other requests.
                     if script:
-                        # Clean the response
-                        cleaned_script = clean_chatgpt_response(script)
-                        narrations.append(cleaned_script)
-                        logging.info(f"Successfully generated script for slide {i+1}")
-                        print(f"[PRINT-DEBUG] _generate_scripts_worker: Script for slide {i+1} gerado com sucesso")
-                    else:
-                        logging.info(f"Failed to generate script for slide {i+1}, using placeholder")
-                        print(f"[PRINT-DEBUG] _generate_scripts_worker: Script for slide {i+1} FALHOU, usando placeholder")
-                        # Add a placeholder script
-                        narrations.append(f"Script for slide {i+1} could not be generated.")
-                    
-                    # Save the prompt to a file
-                    prompts_dir = os.path.join(self.output_dir, 'chatgpt_prompts')
-                    os.makedirs(prompts_dir, exist_ok=True)
-                    prompt_path = os.path.join(prompts_dir, f"slide_{i+1}_prompt.txt")
-                    
-                    with open(prompt_path, 'w', encoding='utf-8') as f:
-                        f.write(formatted_content)
-                    print(f"[PRINT-DEBUG] _generate_scripts_worker: Prompt salvo para slide {i+1}")
-                        
-                except Exception as slide_error:
-                    # Catch errors for individual slides but continue processing
-                    error_msg = f"Error processing slide {i+1}: {str(slide_error)}"
-                    print(f"[PRINT-DEBUG] _generate_scripts_worker: Exception in slide {i+1}: {slide_error}")
-                    logging.error(error_msg)
-                    narrations.append(f"Error generating script for slide {i+1}: {str(slide_error)}")
+                        cache_writes.append(self._submit(store_llm_response, cache_path, script))
+                
+                # Slides finish out of order, so report the number completed rather than the slide index
+                done += 1
+                if done % report_every == 0 or done == num_slides:
+                    self.status_requested.emit(f"Generated scripts for {done}/{num_slides} slides")
+                if script:
+                    return clean_chatgpt_response(script)
+                logging.warning(f"Failed to generate script for slide {i+1}, using placeholder")
+                return f"Script for slide {i+1} could not be generated."
             
-            print("[PRINT-DEBUG] _generate_scripts_worker: FIM, retornando narrations e prompts")
+            results = await asyncio.gather(
+                *(generate_one(i, prompt) for i, prompt in enumerate(prompts)),
+                return_exceptions=True
+            )
+            
+            if cache_hits:
+                logging.info(f"{cache_hits}/{num_slides} scripts served from the LLM response cache")
+            
+            narrations = [None] * num_slides
+            for i, result in enumerate(results):
+                if isinstance(result, Exception):
+                    logging.error(f"Error processing slide {i+1}: {str(result)}")
+                    narrations[i] = f"Error generating script for slide {i+1}: {str(result)}"
+                else:
+                    narrations[i] = result
+            
+            prompts = [p if isinstance(p, str) else "" for p in prompts]
+            # Wait for the disk writes without blocking the loop thread
+            await asyncio.wrap_future(prompt_writes)
+            for error in await asyncio.gather(*map(asyncio.wrap_future, cache_writes), return_exceptions=True):
+                if isinstance(error, Exception):
+                    logging.warning(f"Could not store LLM response in the cache: {error}")
+            
+            logger.debug("[PRINT-DEBUG] _generate_scripts_worker: FIM, retornando narrations e prompts")
             return {"narrations": narrations, "prompts": prompts}
             
         except Exception as e:
-            print(f"[PRINT-DEBUG] _generate_scripts_worker: EXCEPTION GERAL: {e}")
+            logger.debug("[PRINT-DEBUG] _generate_scripts_worker: EXCEPTION GERAL: %s", e)
             logging.error(f"Error in generate_scripts_worker: {e}")
             import traceback
             logging.error(traceback.format_exc())
@@ -778,12 +1573,12 @@ class LaTeX2VideoGUI(QMainWindow):
         # Store the narrations and prompts
         self.narrations = narrations
         self.prompts = prompts
+        self._prompts_loaded = True
         
         # Update the display
         self.update_slide_display()
         
         self.update_status(f"Generated {len(narrations)} narration scripts.")
-        QMessageBox.information(self, "Success", f"Generated {len(narrations)} narration scripts.")
 
     def _on_error(self, error_msg):
         """Handle errors from worker threads"""
@@ -799,116 +1594,217 @@ class LaTeX2VideoGUI(QMainWindow):
         # NOTE: Removed lines that updated self.narrations from self.narration_text (prompt editor).
         # self.narrations should already contain the correct narrations.
         
-        # Save all narrations to files
-        output_dir = os.path.join(self.output_dir, 'chatgpt_responses')
-        os.makedirs(output_dir, exist_ok=True)
-        
-        try:
-            for i, narration in enumerate(self.narrations):
-                file_path = os.path.join(output_dir, f"slide_{i+1}_response.txt")
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(narration)
-            
-            self.update_status("Narration scripts saved.")
-            QMessageBox.information(self, "Success", f"Narration scripts saved to {output_dir}")
-            
-        except Exception as e:
-            logging.error(f"Error saving scripts: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to save scripts: {e}")
-            self.update_status("Error saving scripts.")
+        # Save all narrations to files on the pool; the worker gets a snapshot, not the live list
+        self.update_status("Saving narration scripts...")
+        worker = Worker(self._save_scripts_worker, tuple(self.narrations), self.output_dir)
+        worker.result.connect(self._on_scripts_saved)
+        worker.error.connect(self._on_save_scripts_error)
+        self._start_worker(worker)
+
+    def _save_scripts_worker(self, narrations, output_dir):
+        """Worker function for save_scripts"""
+        self._ensure_dirs(output_dir)
+        self._write_narrations_to_disk(narrations, output_dir)
+        return os.path.join(output_dir, 'chatgpt_responses')
+
+    def _on_scripts_saved(self, responses_dir):
+        """Handle a finished save_scripts worker"""
+        self.update_status(f"Narration scripts saved to {responses_dir}")
+
+    def _on_save_scripts_error(self, error_msg):
+        """Handle a failed save_scripts worker"""
+        logging.error(f"Error saving scripts: {error_msg}")
+        QMessageBox.critical(self, "Error", f"Failed to save scripts: {error_msg}")
+        self.update_status("Error saving scripts.")
+
+    def _write_narrations_to_disk(self, narrations, output_dir) -> int:
+        """Write the narrations to output_dir/chatgpt_responses; touches no widgets, so it can run off the GUI thread.
+        
+        Only narrations that changed since this window last saved them (or whose file was touched since)
+        are rewritten, and the load_scripts snapshot is updated to match. Returns the number of files written.
+        """
+        with self._save_lock:
+            return self._write_narrations_locked(narrations, output_dir)
+
+    def _write_narrations_locked(self, narrations, output_dir) -> int:
+        """_write_narrations_to_disk with self._save_lock held"""
+        responses_dir = os.path.join(output_dir, 'chatgpt_responses')
+        pending = []
+        numbers = []
+        for i, narration in enumerate(narrations):
+            path = os.path.join(responses_dir, RESPONSE_FILE_NAME.format(i + 1))
+            saved = self._saved_narrations.get(path)
+            if saved and saved[0] == narration:
+                try:
+                    if os.stat(path).st_mtime_ns == saved[1]:
+                        continue
+                except FileNotFoundError:
+                    pass
+            pending.append((path, narration))
+            numbers.append(i + 1)
+        # A few small files: one sequential pass over raw fds beats a pool task per file
+        written = {}
+        for number, (path, narration), st in zip(numbers, pending, write_text_files(pending)):
+            self._saved_narrations[path] = (narration, st.st_mtime_ns)
+            written[number] = (narration, st)
+        logging.info(f"Saved {len(pending)} changed narration files ({len(narrations) - len(pending)} unchanged)")
+        if written:
+            state_path = os.path.join(output_dir, SCRIPTS_STATE_FILE)
+            try:
+                patch_scripts_state(state_path, written)
+            except Exception as e:
+                logging.warning(f"Could not update {state_path}: {e}")
+        return len(pending)
 
     def load_scripts(self):
         """Load narration scripts and prompts from files"""
-        import traceback
-        from PyQt5.QtCore import QThread, QTimer, QCoreApplication
-        try:
-            logging.info("[LOAD_SCRIPTS] Iniciando carregamento de scripts")
-            logging.info(f"[LOAD_SCRIPTS] Thread atual: {QThread.currentThread()} (main={QCoreApplication.instance().thread()})")
+        logging.info("[LOAD_SCRIPTS] Iniciando carregamento de scripts")
 
-            responses_dir = os.path.join(self.output_dir, 'chatgpt_responses')
-            prompts_dir = os.path.join(self.output_dir, 'chatgpt_prompts')
-            logging.info(f"[LOAD_SCRIPTS] responses_dir: {responses_dir}")
-            logging.info(f"[LOAD_SCRIPTS] prompts_dir: {prompts_dir}")
-            logging.info(f"[LOAD_SCRIPTS] slides: {len(self.slides)} narrations: {len(self.narrations)} prompts: {len(self.prompts)}")
+        responses_dir = os.path.join(self.output_dir, 'chatgpt_responses')
+        prompts_dir = os.path.join(self.output_dir, 'chatgpt_prompts')
+        logging.info(f"[LOAD_SCRIPTS] responses_dir: {responses_dir}")
+        logging.info(f"[LOAD_SCRIPTS] prompts_dir: {prompts_dir}")
+        logging.info(f"[LOAD_SCRIPTS] slides: {len(self.slides)} narrations: {len(self.narrations)} prompts: {len(self.prompts)}")
 
-            if not os.path.exists(responses_dir):
-                logging.error(f"[LOAD_SCRIPTS] Responses directory not found: {responses_dir}")
-                QMessageBox.critical(self, "Error", f"Responses directory not found: {responses_dir}")
-                return
+        if not os.path.exists(responses_dir):
+            logging.error(f"[LOAD_SCRIPTS] Responses directory not found: {responses_dir}")
+            QMessageBox.critical(self, "Error", f"Responses directory not found: {responses_dir}")
+            return
 
-            # Se não houver slides, carrega apenas as narrações dos arquivos disponíveis
-            if not self.slides:
-                logging.warning("[LOAD_SCRIPTS] Nenhum slide disponível. Carregando scripts apenas para visualização/edição.")
-                files = sorted([f for f in os.listdir(responses_dir) if f.startswith("slide_") and f.endswith("_response.txt")])
-                self.narrations = []
-                for fname in files:
-                    response_path = os.path.join(responses_dir, fname)
-                    with open(response_path, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                        self.narrations.append(content)
-                        logging.info(f"[LOAD_SCRIPTS] Loaded narration {fname}: {repr(content)[:120]} from {response_path}")
-                self.current_slide_index = 0
-                self.update_status(f'Scripts loaded (sem slides LaTeX). Total: {len(self.narrations)}')
-                QMessageBox.information(self, 'Success', f'Scripts loaded (sem slides LaTeX). Total: {len(self.narrations)}')
-                if QThread.currentThread() != QCoreApplication.instance().thread():
-                    QTimer.singleShot(0, self.update_slide_display)
-                else:
-                    self.update_slide_display()
-                return
+        self.update_status('Loading scripts...')
 
-            # Initialize narrations list if needed
-            if len(self.narrations) != len(self.slides):
-                logging.info(f"[LOAD_SCRIPTS] Ajustando narrations para {len(self.slides)}")
-                self.narrations = [""] * len(self.slides)
-
-            # Initialize prompts list if needed
-            if len(self.prompts) != len(self.slides):
-                logging.info(f"[LOAD_SCRIPTS] Ajustando prompts para {len(self.slides)}")
-                self.prompts = [""] * len(self.slides)
-
-            # Load responses for all slides
-            for i in range(len(self.slides)):
-                response_path = os.path.join(responses_dir, f'slide_{i+1}_response.txt')
-                if os.path.exists(response_path):
-                    with open(response_path, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                        self.narrations[i] = content
-                        logging.info(f"[LOAD_SCRIPTS] Loaded narration {i+1}: {repr(content)[:120]} from {response_path}")
-                else:
-                    logging.warning(f"[LOAD_SCRIPTS] Response file not found: {response_path}")
-
-            # Load prompts for all slides if they exist
-            if os.path.exists(prompts_dir):
-                for i in range(len(self.slides)):
-                    prompt_path = os.path.join(prompts_dir, f'slide_{i+1}_prompt.txt')
-                    if os.path.exists(prompt_path):
-                        with open(prompt_path, 'r', encoding='utf-8') as f:
-                            content = f.read().strip()
-                            self.prompts[i] = content
-                            logging.info(f"[LOAD_SCRIPTS] Loaded prompt {i+1}: {repr(content)[:120]} from {prompt_path}")
-                    else:
-                        logging.warning(f"[LOAD_SCRIPTS] Prompt file not found: {prompt_path}")
+        # Run the worker on the shared thread pool
+        worker = Worker(self._load_scripts_worker, responses_dir, prompts_dir, *self._script_paths(len(self.slides)),
+                        os.path.join(self.output_dir, SCRIPTS_STATE_FILE))
+        worker.result.connect(self._on_scripts_loaded)
+        worker.error.connect(self._on_error)
+        self._start_worker(worker)
+
+    def _load_scripts_worker(self, responses_dir, prompts_dir, narration_paths, prompt_paths, state_path):
+        """Worker function for loading scripts.
+        
+        The previous load is reused from state_path when no script file changed since; otherwise the
+        files are read and the snapshot is rewritten.
+        """
+        num_slides = len(narration_paths)
+        # One directory scan per folder instead of an exists() check per slide
+        response_entries = scan_slide_files(responses_dir, RESPONSE_FILE_RE)
+        prompt_entries = {}
+        if num_slides:
+            try:
+                prompt_entries = scan_slide_files(prompts_dir, PROMPT_FILE_RE)
+            except FileNotFoundError:
+                pass
 
-            logging.info(f"[LOAD_SCRIPTS] narrations after load: {len(self.narrations)} prompts after load: {len(self.prompts)}")
-            # Reset current slide index and update the display
-            self.current_slide_index = 0
-            logging.info(f"[LOAD_SCRIPTS] current_slide_index reset to 0")
+        signature = (num_slides, scripts_signature(response_entries), scripts_signature(prompt_entries))
+        result = load_scripts_state(state_path, signature)
+        if result is not None:
+            logging.info(f"[LOAD_SCRIPTS] Loaded {len(response_entries) + len(prompt_entries)} unchanged files from {state_path}")
+            return result
 
-            # Garantir update_slide_display no thread principal
-            if QThread.currentThread() != QCoreApplication.instance().thread():
-                logging.info("[LOAD_SCRIPTS] update_slide_display será chamado via QTimer.singleShot(0, ...) no thread principal")
-                QTimer.singleShot(0, self.update_slide_display)
-            else:
-                self.update_slide_display()
+        result = self._read_scripts(response_entries, prompt_entries, narration_paths, prompt_paths)
+        try:
+            save_scripts_state(state_path, signature, result)
+        except Exception as e:
+            logging.warning(f"[LOAD_SCRIPTS] Could not write {state_path}: {e}")
+        return result
+
+    def _read_scripts(self, response_entries, prompt_entries, narration_paths, prompt_paths):
+        """Read the scanned response and prompt files; the individual file reads run concurrently on the pool.
+        
+        With no parsed slides (empty path lists) every response file found is loaded, in slide order.
+        """
+        num_slides = len(narration_paths)
+        def read_one(entry):
+            content = read_text_file(entry.path, entry.stat().st_size, strip=True)
+            logger.debug("[LOAD_SCRIPTS] Loaded %s: %r", entry.name, content[:120])
+            return content
+
+        # Se não houver slides, carrega apenas as narrações dos arquivos disponíveis
+        if not num_slides:
+            logging.warning("[LOAD_SCRIPTS] Nenhum slide disponível. Carregando scripts apenas para visualização/edição.")
+            narrations = list(self.pool.map(read_one, [response_entries[index] for index in sorted(response_entries)]))
+            return {"narrations": narrations, "prompts": None}
+
+        def load_all(entries, kind, paths):
+            futures = {}
+            for i in range(num_slides):
+                entry = entries.get(i + 1)
+                if entry is not None:
+                    futures[i] = self._submit(read_one, entry)
+                else:
+                    logging.warning(f"[LOAD_SCRIPTS] {kind} file not found: {paths[i]}")
+            return futures
+
+        # None marks slides without a file; the GUI thread keeps what it already has for those
+        narrations = [None] * num_slides
+        prompts = [None] * num_slides
+
+        if liburing is not None:
+            # Submit every response and prompt read to one io_uring instead of one read() per file
+            targets = []
+            for entries, kind, results, paths in (
+                (response_entries, "Response", narrations, narration_paths),
+                (prompt_entries, "Prompt", prompts, prompt_paths),
+            ):
+                for i in range(num_slides):
+                    entry = entries.get(i + 1)
+                    if entry is not None:
+                        targets.append((results, i, entry))
+                    elif entries:
+                        logging.warning(f"[LOAD_SCRIPTS] {kind} file not found: {paths[i]}")
+            try:
+                contents = read_text_files_uring([(entry.path, entry.stat().st_size) for _, _, entry in targets], strip=True)
+                for (results, i, _), content in zip(targets, contents):
+                    results[i] = content
+                logging.info(f"[LOAD_SCRIPTS] Loaded {len(targets)} files with io_uring")
+                return {"narrations": narrations, "prompts": prompts}
+            except OSError as e:
+                logging.warning(f"[LOAD_SCRIPTS] io_uring read failed ({e}), falling back to threaded reads")
+
+        narration_futures = load_all(response_entries, "Response", narration_paths)
+        prompt_futures = load_all(prompt_entries, "Prompt", prompt_paths) if prompt_entries else {}
+
+        for i, future in narration_futures.items():
+            narrations[i] = future.result()
+        for i, future in prompt_futures.items():
+            prompts[i] = future.result()
+        return {"narrations": narrations, "prompts": prompts}
+
+    def _on_scripts_loaded(self, result):
+        """Handle the result of script loading"""
+        narrations = result["narrations"]
+        prompts = result["prompts"]
+
+        if prompts is None:
+            self.narrations = narrations
+            self.current_slide_index = 0
+            self.update_status(f'Scripts loaded (sem slides LaTeX). Total: {len(self.narrations)}')
+            self.update_slide_display()
+            return
 
-            self.update_status('Scripts loaded.')
-            QMessageBox.information(self, 'Success', 'Scripts and prompts loaded.')
+        # Initialize narrations and prompts lists if needed
+        if len(self.narrations) != len(narrations):
+            logging.info(f"[LOAD_SCRIPTS] Ajustando narrations para {len(narrations)}")
+            self.narrations = [""] * len(narrations)
+        if len(self.prompts) != len(prompts):
+            logging.info(f"[LOAD_SCRIPTS] Ajustando prompts para {len(prompts)}")
+            self.prompts = [""] * len(prompts)
+
+        for i, content in enumerate(narrations):
+            if content is not None:
+                self.narrations[i] = content
+        for i, content in enumerate(prompts):
+            if content is not None:
+                self.prompts[i] = content
+        self._prompts_loaded = True
+
+        logging.info(f"[LOAD_SCRIPTS] narrations after load: {len(self.narrations)} prompts after load: {len(self.prompts)}")
+        # Reset current slide index and update the display
+        self.current_slide_index = 0
+        self.update_slide_display()
 
-        except Exception as e:
-            logging.error(f'[LOAD_SCRIPTS] Error loading scripts: {e}')
-            logging.error(traceback.format_exc())
-            QMessageBox.critical(self, 'Error', f'Failed to load scripts: {e}')
-            self.update_status('Error loading scripts.')
+        self.update_status('Scripts loaded.')
 
     def prev_slide(self):
         """Navigate to the previous slide"""
@@ -954,91 +1850,92 @@ class LaTeX2VideoGUI(QMainWindow):
         if len(self.prompts) > self.current_slide_index:
             prompt = self.prompts[self.current_slide_index]
         
-        # If no prompt is available, try to load it from file
-        if not prompt:
-            prompt_path = os.path.join(self.output_dir, 'chatgpt_prompts', f'slide_{self.current_slide_index + 1}_prompt.txt')
+        # If no prompt is available, try to load it from file unless load_scripts already scanned them
+        if not prompt and not self._prompts_loaded:
+            prompt_path = self._script_paths(len(self.slides))[1][self.current_slide_index]
             if os.path.exists(prompt_path):
                 try:
-                    with open(prompt_path, 'r', encoding='utf-8') as f:
-                        prompt = f.read().strip()
-                        # Store the prompt for future use
-                        if len(self.prompts) <= self.current_slide_index:
-                            self.prompts.extend([''] * (self.current_slide_index + 1 - len(self.prompts)))
-                        self.prompts[self.current_slide_index] = prompt
+                    prompt = read_text_file(prompt_path, strip=True)
+                    # Store the prompt for future use
+                    if len(self.prompts) <= self.current_slide_index:
+                        self.prompts.extend([''] * (self.current_slide_index + 1 - len(self.prompts)))
+                    self.prompts[self.current_slide_index] = prompt
                 except Exception as e:
                     logging.error(f'Error loading prompt: {e}')
         
-        # Update ChatGPT response panel with the narration
-        self.slide_content_text.clear()
-        self.slide_content_text.append(narration)
-        
-        # Update ChatGPT prompt panel with the prompt
-        self.narration_text.clear()
-        self.narration_text.append(prompt)
-        
-        # Update slide label
-        self.slide_label.setText(f'Slide: {self.current_slide_index + 1}/{len(self.slides)}')
+        # Batch the widget updates so key-repeat navigation paints once per step;
+        # re-enabling updates schedules that single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Update ChatGPT response panel with the narration (one document reset instead of clear + append)
+            self.slide_content_text.setPlainText(narration)
+            
+            # Update ChatGPT prompt panel with the prompt
+            self.narration_text.setPlainText(prompt)
+            
+            # Update slide label
+            self.slide_label.setText(f'Slide: {self.current_slide_index + 1}/{len(self.slides)}')
+        finally:
+            self.setUpdatesEnabled(True)
         
-        # Try to load and display the slide image
-        self.load_slide_image()
+        # Load and display the slide image once navigation settles
+        self._slide_image_timer.start(SLIDE_IMAGE_DELAY_MS)
+
+    def _refresh_slide_image_index(self):
+        """Rescan the slides directory into the slide number -> image path index"""
+        # Absolute paths, so the abspath() calls on the navigation path never need getcwd()
+        slides_dir = os.path.abspath(os.path.join(self.output_dir, 'slides'))
+        try:
+            self._slide_image_index = scan_slide_images(slides_dir)
+        except OSError:
+            self._slide_image_index = {}
+        return self._slide_image_index
 
     def load_slide_image(self):
         """Load and display the current slide image if it exists"""
+        self._nav_token += 1
+        
         # Clear current image
         self.slide_image_label.clear()
         self.slide_image_label.setText('No image available')
         
-        # Check if the slides directory exists
-        slides_dir = os.path.join(self.output_dir, 'slides')
-        if not os.path.exists(slides_dir):
-            return
-        
-        # Try to find the image for the current slide
-        slide_number = self.current_slide_index + 1
-        
         # Store the image path for potential resizing
         self.current_image_path = None
+        self._original_pixmap = None
+        
+        # One directory scan serves every navigation until the images change
+        index = self._slide_image_index
+        if index is None:
+            index = self._refresh_slide_image_index()
+        # Index paths are already absolute, so they key the pixmap caches as-is
+        image_path = index.get(self.current_slide_index + 1)
+        if not image_path:
+            return
         
-        # Check for common image formats, with and without leading zeros
-        for ext in ['png', 'jpg', 'jpeg']:
-            # Try with leading zeros (slide_001.png)
-            image_path_zeros = os.path.join(slides_dir, f'slide_{slide_number:03d}.{ext}')
-            if os.path.exists(image_path_zeros):
-                try:
-                    pixmap = QPixmap(image_path_zeros)
-                    if not pixmap.isNull():
-                        self.current_image_path = image_path_zeros
-                        pixmap = pixmap.scaled(
-                            self.slide_image_label.width(),
-                            self.slide_image_label.height(),
-                            Qt.KeepAspectRatio,
-                            Qt.SmoothTransformation
-                        )
-                        self.slide_image_label.setPixmap(pixmap)
-                        self.slide_image_label.setText('')
-                        self.update_status(f'Loaded slide image: {image_path_zeros}')
-                        return
-                except Exception as e:
-                    logging.error(f'Error loading image {image_path_zeros}: {e}')
-            # Try without leading zeros (slide_1.png)
-            image_path = os.path.join(slides_dir, f'slide_{slide_number}.{ext}')
-            if os.path.exists(image_path):
-                try:
-                    pixmap = QPixmap(image_path)
-                    if not pixmap.isNull():
-                        self.current_image_path = image_path
-                        pixmap = pixmap.scaled(
-                            self.slide_image_label.width(),
-                            self.slide_image_label.height(),
-                            Qt.KeepAspectRatio,
-                            Qt.SmoothTransformation
-                        )
-                        self.slide_image_label.setPixmap(pixmap)
-                        self.slide_image_label.setText('')
-                        self.update_status(f'Loaded slide image: {image_path}')
-                        return
-                except Exception as e:
-                    logging.error(f'Error loading image {image_path}: {e}')
+        try:
+            pixmap = self._memoized_scaled_pixmap(image_path)
+            if pixmap is None and image_path not in self._pix_cache:
+                # Not prewarmed yet: decode on the pool so the GUI thread keeps painting; the same decode
+                # fills the screen-size cache, so no separate prewarm task is submitted for this slide
+                self.slide_image_label.setText('Loading image...')
+                self._submit(self._decode_slide_image, self._nav_token, image_path, self._label_size(),
+                             self._preview_max_size())
+                return
+            if pixmap is None:
+                # Show a nearest-neighbour scale right away; the resize timer swaps in the smooth one
+                pixmap = self._cached_pixmap(image_path)
+                if not pixmap.isNull():
+                    pixmap = pixmap.scaled(
+                        self.slide_image_label.width(),
+                        self.slide_image_label.height(),
+                        Qt.KeepAspectRatio,
+                        Qt.FastTransformation
+                    )
+                    self._resize_timer.start(SMOOTH_UPGRADE_MS)
+            if not pixmap.isNull():
+                self._show_slide_pixmap(image_path, pixmap)
+        except Exception as e:
+            logging.error(f'Error loading image {image_path}: {e}')
 
     def generate_scripts(self):
         """Generate narration scripts for all slides using OpenAI API"""
@@ -1051,10 +1948,9 @@ class LaTeX2VideoGUI(QMainWindow):
             QMessageBox.critical(self, "Error", "Failed to load configuration. Please check your config file.")
             return
 
-        # Initialize OpenAI client
+        # Reuse the persistent async client so its connection pool survives between runs
         try:
-            from src.openai_script_generator import initialize_openai_client
-            client = initialize_openai_client(self.config)
+            client = self.async_openai_client
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to initialize OpenAI client: {e}")
             return
@@ -1065,34 +1961,15 @@ class LaTeX2VideoGUI(QMainWindow):
 
         self.update_status("Generating narration scripts with OpenAI API...")
 
-        # Create a worker thread
-        thread = QThread()
+        # Run the worker on the shared thread pool
         worker = Worker(self._generate_scripts_worker, client)
-        worker.moveToThread(thread)
-
-        # Keep explicit references to prevent garbage collection
-        self._current_scripts_thread = thread
-        self._current_scripts_worker = worker
-
-        # Connect signals
-        thread.started.connect(worker.run)
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
         worker.result.connect(self._on_scripts_generated)
         worker.error.connect(self._on_error)
-        worker.progress.connect(self.update_status)
-
-        # Start the thread
-        thread.start()
-        print("[PRINT-DEBUG] QThread started for script generation")
-
-        # Keep a reference to the thread
-        self.threads.append(thread)
+        self._start_worker(worker)
 
     def generate_images(self):
         """Generate images from the LaTeX file"""
-        print("[PRINT-DEBUG] ENTERED generate_images(self)")
+        logger.debug("[PRINT-DEBUG] ENTERED generate_images(self)")
         if not self.load_config():
             return
 
@@ -1110,40 +1987,25 @@ class LaTeX2VideoGUI(QMainWindow):
 
         self.update_status('Generating slide images...')
 
-        # Create a worker thread
-        thread = QThread()
+        # Run the worker on the shared thread pool
         worker = Worker(self._generate_images_worker, latex_file)
-        worker.moveToThread(thread)
-
-        # Keep explicit references to prevent garbage collection
-        self._current_image_thread = thread
-        self._current_image_worker = worker
-
-        # Connect signals
-        thread.started.connect(worker.run)
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
         worker.result.connect(self._on_images_generated)
         worker.error.connect(self._on_error)
-
-        # Start the thread
-        thread.start()
-        print("[PRINT-DEBUG] QThread started for image generation")
-
-        # Keep a reference to the thread
-        self.threads.append(thread)
+        self._start_worker(worker)
 
     def _generate_images_worker(self, latex_file):
         """Worker function for generating images"""
-        print("[PRINT-DEBUG] ENTERED _generate_images_worker")
+        logger.debug("[PRINT-DEBUG] ENTERED _generate_images_worker")
         # Add the LaTeX file path to the configuration
-        config_copy = self.config.copy()
-        config_copy['latex_file_path'] = os.path.abspath(latex_file)
+        config_copy = dict(self._config_view, latex_file_path=os.path.abspath(latex_file))
         
-        print("[PRINT-DEBUG] About to call generate_slide_images in src.image_generator.py")
-        # Generate slide images
-        return generate_slide_images(latex_file, config_copy)
+        logger.debug("[PRINT-DEBUG] About to call generate_slide_images in src.image_generator.py")
+        from src.image_generator import generate_slide_images
+        # Generate slide images, converting pages concurrently on the shared pool
+        image_paths = generate_slide_images(latex_file, config_copy, executor=self.pool,
+                                            progress=self.status_requested.emit)
+        logging.info(f"Rendered {len(image_paths)} slide images")
+        return image_paths
 
     def _on_images_generated(self, image_paths):
         """Handle the result of image generation"""
@@ -1153,91 +2015,35 @@ class LaTeX2VideoGUI(QMainWindow):
             return
         
         self.update_status(f'Generated {len(image_paths)} slide images.')
-        
-        # Update the slide display to show the current slide image
-        self.load_slide_image()
-        
-        QMessageBox.information(self, 'Success', f'Generated {len(image_paths)} slide images.')
+        self._slide_image_index = None
+        self._scaled_pix_cache.clear()
+        self._show_and_prewarm(image_paths)
 
-    def generate_audio(self):
-        """Generate audio files from narration scripts"""
-        if not self.load_config():
-            return
-
-        if not self.slides or not self.narrations:
-            QMessageBox.critical(self, 'Error', 'No narration scripts available. Por favor, gere os scripts antes de gerar o áudio.')
-            return
-
-        # Verificação extra: garantir que as narrações não estejam vazias ou só com placeholders
-        narrations_validas = [n for n in self.narrations if n.strip() and not n.strip().startswith("Script for slide") and not n.strip().startswith("Error generating script")]
-        if len(narrations_validas) < len(self.narrations):
-            QMessageBox.critical(self, 'Error', 'Algumas narrações estão vazias ou inválidas. Gere os scripts para todos os slides antes de gerar o áudio.')
-            self.update_status('Erro: narrações vazias ou inválidas detectadas.')
-            return
-
-        # Save current narration - REMOVED, self.narrations should already be correct.
-        # current_narration = self.narration_text.toPlainText().strip() 
-        # self.narrations[self.current_slide_index] = current_narration
-
-        # Save all narrations to files first
-        self.save_scripts() # This will now save the correct self.narrations
-
-        self.update_status('Generating audio files...')
-
-        # Create a worker thread
-        thread = QThread()
-        print("[PYQT_DEBUG] generate_audio: QThread object created.")
-        print("[PRINT-DEBUG] generate_audio: thread criado") # Existing user debug
-        worker = Worker(self._generate_audio_worker)
-        print("[PYQT_DEBUG] generate_audio: Worker object created.")
-        worker.moveToThread(thread)
-        print("[PYQT_DEBUG] generate_audio: Worker moved to thread.")
-        print("[PRINT-DEBUG] Depois worker.moveToThread(thread)") # Existing user debug
-        
-        # Connect signals
-        print("[PYQT_DEBUG] generate_audio: Connecting signals...")
-        thread.started.connect(lambda: print("[PYQT_DEBUG] generate_audio: thread.started SIGNAL EMITTED! (Lambda)")) # Diagnostic print
-        thread.started.connect(worker.run)
-        print("[PYQT_DEBUG] generate_audio: thread.started.connect(worker.run) connected.")
-        worker.finished.connect(thread.quit)
-        print("[PYQT_DEBUG] generate_audio: worker.finished.connect(thread.quit) connected.")
-        # worker.finished.connect(worker.deleteLater) # TEST: Commented out
-        # print("[PYQT_DEBUG] generate_audio: worker.finished.connect(worker.deleteLater) - COMMENTED OUT FOR TEST.")
-        
-        print("[PRINT-DEBUG] Depois 2 worker.moveToThread(thread)") # Existing user debug
-        # thread.finished.connect(thread.deleteLater) # TEST: Commented out
-        # print("[PYQT_DEBUG] generate_audio: thread.finished.connect(thread.deleteLater) - COMMENTED OUT FOR TEST.")
-        worker.result.connect(self._on_audio_generated)
-        print("[PYQT_DEBUG] generate_audio: worker.result.connect(self._on_audio_generated) connected.")
-        worker.error.connect(self._on_error)
-        print("[PYQT_DEBUG] generate_audio: worker.error.connect(self._on_error) connected.")
-        print("[PYQT_DEBUG] generate_audio: All signals connected.")
-
-        print("[PRINT-DEBUG] Depois 3 worker.moveToThread(thread)") # Existing user debug
-        # Start the thread
-        print("[PYQT_DEBUG] generate_audio: About to start thread...")
-        thread.start()
-        print("[PYQT_DEBUG] generate_audio: Thread started command issued.")
-
-        # Keep a reference to the thread
-        self.threads.append(thread)
-        print("[PYQT_DEBUG] 2 generate_audio: Thread started command issued.")
+    def _show_and_prewarm(self, image_paths):
+        """Show the current slide image, then decode every other slide in the background so navigation only swaps cached pixmaps"""
+        self.load_slide_image()
+        # load_slide_image already decodes the current slide into the cache
+        current = (self._slide_image_index or {}).get(self.current_slide_index + 1)
+        size = self._preview_max_size()
+        for path in image_paths:
+            if os.path.abspath(path) != current:
+                self._submit(self._prewarm, path, size)
 
     def _test_gtts_import_in_thread_worker(self):
         """Dummy worker to test gTTS import within a QThread."""
-        print("[PYQT_DEBUG] _test_gtts_import_in_thread_worker: Entered.")
+        logger.debug("[PYQT_DEBUG] _test_gtts_import_in_thread_worker: Entered.")
         try:
-            print("[PYQT_DEBUG] _test_gtts_import_in_thread_worker: Attempting to import gtts...")
+            logger.debug("[PYQT_DEBUG] _test_gtts_import_in_thread_worker: Attempting to import gtts...")
             from gtts import gTTS
-            print("[PYQT_DEBUG] _test_gtts_import_in_thread_worker: gtts imported successfully inside worker.")
+            logger.debug("[PYQT_DEBUG] _test_gtts_import_in_thread_worker: gtts imported successfully inside worker.")
             # You could even try to instantiate it:
             # test_tts = gTTS(text='test', lang='en')
             # print("[PYQT_DEBUG] _test_gtts_import_in_thread_worker: gTTS object instantiated successfully.")
             return "gTTS import test successful"
         except Exception as e:
-            print(f"[PYQT_DEBUG] _test_gtts_import_in_thread_worker: Exception during gTTS import/test - {e}")
+            logger.debug("[PYQT_DEBUG] _test_gtts_import_in_thread_worker: Exception during gTTS import/test - %s", e)
             import traceback
-            print(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             raise
 
     def generate_audio(self):
@@ -1261,83 +2067,74 @@ class LaTeX2VideoGUI(QMainWindow):
         # current_narration = self.narration_text.toPlainText().strip()
         # self.narrations[self.current_slide_index] = current_narration
 
-        # Save all narrations to files first
-        self.save_scripts() # This will save the current state of self.narrations
+        # The narrations are saved to files by the worker, before synthesis starts, so the
+        # writes don't block the event loop
+        self._ensure_dirs(self.output_dir)
 
         self.update_status('Generating audio files...')
 
-        # Create a worker thread
-        self._current_audio_thread = QThread() # Store as instance attribute
-        thread = self._current_audio_thread # Use local alias for convenience
-        print("[PYQT_DEBUG] generate_audio: QThread object created and stored as self._current_audio_thread.")
-        print("[PRINT-DEBUG] generate_audio: thread criado") # Existing user debug
-        
-        self._current_audio_worker = Worker(self._generate_audio_worker) # Store as instance attribute
-        worker = self._current_audio_worker # Use local alias
-        print("[PYQT_DEBUG] generate_audio: Worker object created and stored as self._current_audio_worker.")
-        worker.moveToThread(thread)
-        print("[PYQT_DEBUG] generate_audio: Worker moved to thread.")
-        print("[PRINT-DEBUG] Depois worker.moveToThread(thread)") # Existing user debug
-        
-        # Connect signals
-        print("[PYQT_DEBUG] generate_audio: Connecting signals...")
-        thread.started.connect(lambda: print("[PYQT_DEBUG] generate_audio: thread.started SIGNAL EMITTED! (Lambda in second method)")) # Diagnostic print
-        thread.started.connect(worker.run)
-        print("[PYQT_DEBUG] generate_audio: thread.started.connect(worker.run) connected.")
-        worker.finished.connect(thread.quit)
-        print("[PYQT_DEBUG] generate_audio: worker.finished.connect(thread.quit) connected.")
-        worker.finished.connect(worker.deleteLater) 
-        print("[PYQT_DEBUG] generate_audio: worker.finished.connect(worker.deleteLater) connected.")
-        
-        print("[PRINT-DEBUG] Depois 2 worker.moveToThread(thread)") # Existing user debug
-        thread.finished.connect(thread.deleteLater) 
-        print("[PYQT_DEBUG] generate_audio: thread.finished.connect(thread.deleteLater) connected.")
+        # Run the worker on the shared thread pool; the narrations are snapshotted here,
+        # they are only ever edited on the GUI thread so this cannot race
+        worker = Worker(self._generate_audio_worker, tuple(self.narrations), self.output_dir)
         worker.result.connect(self._on_audio_generated)
-        print("[PYQT_DEBUG] generate_audio: worker.result.connect(self._on_audio_generated) connected.")
         worker.error.connect(self._on_error)
-        print("[PYQT_DEBUG] generate_audio: worker.error.connect(self._on_error) connected.")
-        print("[PYQT_DEBUG] generate_audio: All signals connected.")
-
-        print("[PRINT-DEBUG] Depois 3 worker.moveToThread(thread)") # Existing user debug
-        # Start the thread
-        print("[PYQT_DEBUG] generate_audio: About to start thread...")
-        thread.start()
-        print("[PYQT_DEBUG] generate_audio: Thread started command issued.")
-
-        # Keep a reference to the thread (optional if stored as instance var, but doesn't hurt)
-        self.threads.append(thread)
-
-    def _generate_audio_worker(self):
-        """Worker function for generating audio"""
-        print("[PYQT_DEBUG] _generate_audio_worker: Entered.")
+        self._start_worker(worker)
+
+    def _get_tts_provider(self, config):
+        """Return the TTS provider for the current config, reusing it across runs"""
+        key = repr((config.get('tts'), config.get('elevenlabs')))
+        if self._tts_provider is None or self._tts_provider_key != key:
+            from src.tts_provider import create_tts_provider
+            self._tts_provider = create_tts_provider(config)
+            self._tts_provider_key = key
+        return self._tts_provider
+
+    def _audio_executor(self, workers: int) -> ThreadPoolExecutor:
+        """Return the TTS thread pool, rebuilt only when the configured concurrency changes"""
+        if self._audio_exec is None or self._audio_exec_workers != workers:
+            if self._audio_exec is not None:
+                self._audio_exec.shutdown(wait=False)
+            self._audio_exec = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='l2v-tts')
+            self._audio_exec_workers = workers
+        return self._audio_exec
+
+    async def _generate_audio_worker(self, narrations, output_dir):
+        """Worker coroutine for saving the narrations and generating audio for all slides concurrently"""
+        logger.debug("[PYQT_DEBUG] _generate_audio_worker: Entered.")
         import traceback
         try:
-            print("[PYQT_DEBUG] _generate_audio_worker: Making copies of narrations and config.")
-            narrations_copy = self.narrations.copy()
-            config_copy = self.config.copy()
+            await asyncio.to_thread(self._write_narrations_to_disk, narrations, output_dir)
+            config_copy = self._config_view
             
             # Using print instead of logging for immediate flush before potential crash
-            print(f"[PYQT_DEBUG] [AUDIO_WORKER] Iniciando geração de áudio. Narrations count: {len(narrations_copy)}")
-            print(f"[PYQT_DEBUG] [AUDIO_WORKER] Config output_dir: {config_copy.get('output_dir')}")
+            logger.debug("[PYQT_DEBUG] [AUDIO_WORKER] Iniciando geração de áudio. Narrations count: %s", len(narrations))
+            logger.debug("[PYQT_DEBUG] [AUDIO_WORKER] Config output_dir: %s", config_copy.get('output_dir'))
             
             # Log narrations if needed, but can be verbose
-            # for idx, n in enumerate(narrations_copy):
+            # for idx, n in enumerate(narrations):
             #     print(f"[PYQT_DEBUG] [AUDIO_WORKER] Narration {idx+1} (preview): {repr(n)[:60]}")
 
-            print("[PYQT_DEBUG] _generate_audio_worker: About to call generate_all_audio from src.audio_generator.")
-            audio_paths = generate_all_audio(narrations_copy, config_copy)
-            print(f"[PYQT_DEBUG] _generate_audio_worker: generate_all_audio returned. Result: {audio_paths}")
+            logger.debug("[PYQT_DEBUG] _generate_audio_worker: About to call generate_all_audio_async from src.audio_generator.")
+            from src.audio_generator import generate_all_audio_async
+            from src.tts_provider import tts_concurrency
+            tts_provider = self._get_tts_provider(config_copy)
+            workers = tts_concurrency(config_copy, tts_provider) if tts_provider else 1
+            audio_paths = await generate_all_audio_async(narrations, config_copy, tts_provider,
+                                                         progress=self.status_requested.emit,
+                                                         executor=self._audio_executor(workers),
+                                                         cache_dir=self._tts_cache_dir)
+            logger.debug("[PYQT_DEBUG] _generate_audio_worker: generate_all_audio_async returned. Result: %s", audio_paths)
             
             if not audio_paths:
-                print("[PYQT_DEBUG] [AUDIO_WORKER] Nenhum arquivo de áudio foi gerado (audio_paths is None or empty).")
+                logger.debug("[PYQT_DEBUG] [AUDIO_WORKER] Nenhum arquivo de áudio foi gerado (audio_paths is None or empty).")
             else:
                 for path in audio_paths:
-                    print(f"[PYQT_DEBUG] [AUDIO_WORKER] Áudio gerado: {path}")
-            print("[PYQT_DEBUG] _generate_audio_worker: Returning audio_paths.")
+                    logger.debug("[PYQT_DEBUG] [AUDIO_WORKER] Áudio gerado: %s", path)
+            logger.debug("[PYQT_DEBUG] _generate_audio_worker: Returning audio_paths.")
             return audio_paths
         except Exception as e:
-            print(f"[PYQT_DEBUG] [AUDIO_WORKER] Exception in _generate_audio_worker: {e}")
-            print(traceback.format_exc()) # Print traceback directly
+            logger.debug("[PYQT_DEBUG] [AUDIO_WORKER] Exception in _generate_audio_worker: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             # logging.error(f"[AUDIO_WORKER] Exception: {e}") # Keep logging if preferred
             # logging.error(traceback.format_exc())
             raise # Re-raise to be caught by Worker's main try-except
@@ -1355,7 +2152,6 @@ class LaTeX2VideoGUI(QMainWindow):
             logging.info(f"[ON_AUDIO_GENERATED] Áudio gerado: {path}")
 
         self.update_status(f'Generated {len(audio_paths)} audio files.')
-        QMessageBox.information(self, 'Success', f'Generated {len(audio_paths)} audio files.')
 
     def assemble_video(self):
         """Assemble the final video from images and audio"""
@@ -1366,49 +2162,43 @@ class LaTeX2VideoGUI(QMainWindow):
         slides_dir = os.path.join(self.output_dir, 'slides')
         audio_dir = os.path.join(self.output_dir, 'audio')
         
-        if not os.path.exists(slides_dir) or not os.listdir(slides_dir):
+        if not has_slide_file(slides_dir, SLIDE_IMAGE_RE):
             QMessageBox.critical(self, 'Error', 'No slide images found. Please generate images first.')
             return
         
-        if not os.path.exists(audio_dir) or not os.listdir(audio_dir):
+        if not has_slide_file(audio_dir, AUDIO_FILE_RE):
             QMessageBox.critical(self, 'Error', 'No audio files found. Please generate audio first.')
             return
         
         self.update_status('Assembling video...')
         
-        # Create a worker thread
-        thread = QThread()
+        # Run the worker on the shared thread pool
         worker = Worker(self._assemble_video_worker, slides_dir, audio_dir)
-        worker.moveToThread(thread)
-        
-        # Connect signals
-        thread.started.connect(worker.run)
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
         worker.result.connect(self._on_video_assembled)
         worker.error.connect(self._on_error)
-        
-        # Start the thread
-        thread.start()
-        
-        # Keep a reference to the thread
-        self.threads.append(thread)
+        self._start_worker(worker)
 
     def _assemble_video_worker(self, slides_dir, audio_dir):
         """Worker function for assembling video"""
-        # Get image and audio files
-        image_files = sorted([os.path.join(slides_dir, f) for f in os.listdir(slides_dir) if f.endswith(('.png', '.jpg', '.jpeg'))])
-        audio_files = sorted([os.path.join(audio_dir, f) for f in os.listdir(audio_dir) if f.endswith('.mp3')])
+        # Get image and audio files, one scandir each, in slide order
+        images = scan_slide_images(slides_dir)
+        audio = scan_slide_files(audio_dir, AUDIO_FILE_RE)
+        image_files = [images[number] for number in sorted(images)]
+        audio_files = [audio[number].path for number in sorted(audio)]
         
         if len(image_files) != len(audio_files):
             raise ValueError(f'Mismatch between number of images ({len(image_files)}) and audio files ({len(audio_files)}).')
         
-        # Make a copy of the config to avoid thread issues
-        config_copy = self.config.copy()
+        return self._assemble_video_files(image_files, audio_files)
+
+    def _assemble_video_files(self, image_files, audio_files):
+        """Assemble the video from image and audio files given in slide order"""
+        config_copy = self._config_view
         
         # Assemble video
-        return assemble_video(image_files, audio_files, config_copy)
+        from src.simple_video_assembler import assemble_video
+        return assemble_video(image_files, audio_files, config_copy,
+                              hwaccel=config_copy.get('ffmpeg', {}).get('hwaccel', 'auto'))
 
     def _on_video_assembled(self, output_path):
         """Handle the result of video assembly"""
@@ -1418,7 +2208,6 @@ class LaTeX2VideoGUI(QMainWindow):
             return
         
         self.update_status(f'Video assembled: {output_path}')
-        QMessageBox.information(self, 'Success', f'Video assembled: {output_path}')
 
     def generate_all(self):
         """Generate everything: images, audio, and video"""
@@ -1439,35 +2228,19 @@ class LaTeX2VideoGUI(QMainWindow):
         if self.current_slide_index < len(self.prompts):
             self.prompts[self.current_slide_index] = current_prompt_text
         
-        # Save all narrations and prompts to files
-        self.save_scripts() # This will save self.narrations (responses)
+        # The audio worker saves the narrations (responses) before synthesizing them
         # Consider adding a self.save_prompts() if you want to explicitly save self.prompts to _prompt.txt here as well,
         # though _generate_scripts_worker already saves prompts.
-        # For now, the key is that self.narrations is correct for audio generation.
+        self._ensure_dirs(self.output_dir)
         
         self.update_status('Generating everything...')
         
-        # Step 1: Generate images
-        self.update_status('Step 1: Generating slide images...')
-        
-        # Create a worker thread for image generation
-        thread1 = QThread()
-        worker1 = Worker(self._generate_images_worker, latex_file)
-        worker1.moveToThread(thread1)
-        
-        # Connect signals
-        thread1.started.connect(worker1.run)
-        worker1.finished.connect(thread1.quit)
-        worker1.finished.connect(worker1.deleteLater)
-        thread1.finished.connect(thread1.deleteLater)
-        worker1.result.connect(lambda image_paths: self._continue_with_audio(image_paths))
-        worker1.error.connect(self._on_error)
-        
-        # Start the thread
-        thread1.start()
-        
-        # Keep a reference to the thread
-        self.threads.append(thread1)
+        # One worker runs every stage; progress comes back through status_requested
+        self.update_status('Step 1: Generating slide images and audio files...')
+        worker = Worker(self._full_pipeline_worker, latex_file, tuple(self.narrations), self.output_dir)
+        worker.result.connect(self._on_pipeline_done)
+        worker.error.connect(self._on_error)
+        self._start_worker(worker)
 
     def load_existing_images_qt(self):
         """Check for existing images in the output directory (PyQt version)"""
@@ -1481,7 +2254,7 @@ class LaTeX2VideoGUI(QMainWindow):
             return
 
         try:
-            image_files = [f for f in os.listdir(slides_dir) if f.endswith(('.png', '.jpg', '.jpeg'))]
+            image_files = self._refresh_slide_image_index()
             if image_files:
                 QMessageBox.information(self, "Success", f"Found {len(image_files)} existing images in {slides_dir}.")
                 self.update_status(f"Checked for existing images: {len(image_files)} found.")
@@ -1508,7 +2281,7 @@ class LaTeX2VideoGUI(QMainWindow):
             return
 
         try:
-            audio_files = [f for f in os.listdir(audio_dir) if f.endswith('.mp3')]
+            audio_files = scan_slide_files(audio_dir, AUDIO_FILE_RE)
             if audio_files:
                 QMessageBox.information(self, "Success", f"Found {len(audio_files)} existing audio files in {audio_dir}.")
                 self.update_status(f"Checked for existing audio: {len(audio_files)} files found.")
@@ -1520,81 +2293,65 @@ class LaTeX2VideoGUI(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to check for existing audio: {e}")
             self.update_status("Error checking for existing audio.")
     
-    def _continue_with_audio(self, image_paths):
-        """Continue with audio generation after images are generated"""
-        if not image_paths:
-            QMessageBox.critical(self, 'Error', 'Failed to generate slide images.')
-            self.update_status('Failed to generate slide images.')
-            return
-        
-        self.update_status(f'Generated {len(image_paths)} slide images.')
-        
-        # Step 2: Generate audio
-        self.update_status('Step 2: Generating audio files...')
-        
-        # Create a worker thread for audio generation
-        thread2 = QThread()
-        worker2 = Worker(self._generate_audio_worker)
-        worker2.moveToThread(thread2)
-        
-        # Connect signals
-        thread2.started.connect(worker2.run)
-        worker2.finished.connect(thread2.quit)
-        worker2.finished.connect(worker2.deleteLater)
-        thread2.finished.connect(thread2.deleteLater)
-        worker2.result.connect(lambda audio_paths: self._continue_with_video(image_paths, audio_paths))
-        worker2.error.connect(self._on_error)
-        
-        # Start the thread
-        thread2.start()
-        
-        # Keep a reference to the thread
-        self.threads.append(thread2)
-    
-    def _continue_with_video(self, image_paths, audio_paths):
-        """Continue with video assembly after audio is generated"""
-        if not audio_paths:
-            QMessageBox.critical(self, 'Error', 'Failed to generate audio files.')
-            self.update_status('Failed to generate audio files.')
-            return
-        
-        self.update_status(f'Generated {len(audio_paths)} audio files.')
-        
-        # Step 3: Assemble video
-        self.update_status('Step 3: Assembling final video...')
+    async def _full_pipeline_worker(self, latex_file, narrations, output_dir):
+        """Worker coroutine for generate_all: images and audio at the same time, then the video.
+        
+        The stages hand their results to each other directly instead of going back through the GUI thread.
+        Returns a dict with the 'images', 'audio' and 'video' results; a stage that failed leaves the later ones None,
+        and 'errors' maps each stage that raised to its message. An exception in one of the concurrent stages
+        does not discard the other's result.
+        """
+        # The image worker converts pages on self.pool itself, so it runs on the loop's default executor
+        outcomes = await asyncio.gather(
+            asyncio.to_thread(self._generate_images_worker, latex_file),
+            self._generate_audio_worker(narrations, output_dir),
+            return_exceptions=True
+        )
+        result = {'images': None, 'audio': None, 'video': None, 'errors': {}}
+        for stage, outcome in zip(('images', 'audio'), outcomes):
+            if isinstance(outcome, BaseException):
+                logging.error(f"[PIPELINE] {stage} stage failed: {outcome}", exc_info=outcome)
+                result['errors'][stage] = str(outcome)
+            else:
+                result[stage] = outcome
+        image_paths, audio_paths = result['images'], result['audio']
+        if not image_paths or not audio_paths:
+            return result
         
-        # Check if the number of images matches the number of audio files
+        self.status_requested.emit(f'Generated {len(image_paths)} slide images and {len(audio_paths)} audio files.')
+        self.status_requested.emit('Step 2: Assembling final video...')
         if len(image_paths) != len(audio_paths):
-            QMessageBox.warning(self, 'Warning', 
-                f'Mismatch between number of images ({len(image_paths)}) and audio files ({len(audio_paths)}). Using the minimum number.')
-            # Use the minimum number of files
+            logging.warning(f'Mismatch between number of images ({len(image_paths)}) and audio files '
+                            f'({len(audio_paths)}). Using the minimum number.')
             count = min(len(image_paths), len(audio_paths))
-            image_paths = image_paths[:count]
-            audio_paths = audio_paths[:count]
-        
-        # Get the directories
-        slides_dir = os.path.join(self.output_dir, 'slides')
-        audio_dir = os.path.join(self.output_dir, 'audio')
-        
-        # Create a worker thread for video assembly
-        thread3 = QThread()
-        worker3 = Worker(self._assemble_video_worker, slides_dir, audio_dir)
-        worker3.moveToThread(thread3)
+            image_paths, audio_paths = image_paths[:count], audio_paths[:count]
         
-        # Connect signals
-        thread3.started.connect(worker3.run)
-        worker3.finished.connect(thread3.quit)
-        worker3.finished.connect(worker3.deleteLater)
-        thread3.finished.connect(thread3.deleteLater)
-        worker3.result.connect(self._on_video_assembled)
-        worker3.error.connect(self._on_error)
-        
-        # Start the thread
-        thread3.start()
-        
-        # Keep a reference to the thread
-        self.threads.append(thread3)
-
+        # Both lists are already in slide order, so the output directories need no rescan
+        try:
+            result['video'] = await asyncio.to_thread(self._assemble_video_files, image_paths, audio_paths)
+        except Exception as e:
+            logging.error(f"[PIPELINE] video stage failed: {e}", exc_info=True)
+            result['errors']['video'] = str(e)
+        return result
+
+    def _on_pipeline_done(self, result):
+        """Handle the result of generate_all"""
+        if result['images']:
+            # The slide images were regenerated; reload the one on screen and prewarm the rest
+            self._slide_image_index = None
+            self._scaled_pix_cache.clear()
+            self._show_and_prewarm(result['images'])
+        errors = result['errors']
+        for stage, what in (('images', 'slide images'), ('audio', 'audio files')):
+            if not result[stage]:
+                detail = f': {errors[stage]}' if stage in errors else '.'
+                QMessageBox.critical(self, 'Error', f'Failed to generate {what}{detail}')
+                self.update_status(f'Failed to generate {what}.')
+                return
+        if 'video' in errors:
+            self._on_error(errors['video'])
+            return
+        self._on_video_assembled(result['video'])
 
 from PyQt5.QtGui import QFont
 
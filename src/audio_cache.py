@@ -0,0 +1,85 @@
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+from typing import Dict, Optional
+
+# Get a logger for this module
+logger = logging.getLogger(__name__)
+
+# Synthesized narrations keyed by provider, voice settings and text; survives clearing the output directory
+AUDIO_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'tts')
+# Kept in the audio output directory: file name -> [cache key, st_mtime_ns, st_size] of outputs taken from the cache
+AUDIO_INDEX_FILE = 'index.json'
+
+def audio_cache_key(text: str, tts_provider) -> str:
+    """Cache key for text spoken by tts_provider with its current voice settings."""
+    parts = (tts_provider.__class__.__name__,) + tuple(tts_provider.cache_settings()) + (text,)
+    return hashlib.sha256('\0'.join(map(str, parts)).encode('utf-8')).hexdigest()
+
+def load_audio_index(audio_dir: str) -> Dict[str, list]:
+    """The audio index of audio_dir, or an empty one if it is missing or unreadable."""
+    try:
+        with open(os.path.join(audio_dir, AUDIO_INDEX_FILE), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        return index if isinstance(index, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"[AUDIO_CACHE] Ignoring unreadable audio index in {audio_dir}: {e}")
+        return {}
+
+def save_audio_index(audio_dir: str, index: Dict[str, list]) -> None:
+    """Atomically write the audio index of audio_dir."""
+    fd, tmp_path = tempfile.mkstemp(dir=audio_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, os.path.join(audio_dir, AUDIO_INDEX_FILE))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _index_entry(key: str, path: str) -> list:
+    st = os.stat(path)
+    return [key, st.st_mtime_ns, st.st_size]
+
+def restore_cached_audio(cache_dir: str, key: str, output_path: str, index: Optional[Dict[str, list]] = None) -> bool:
+    """Put the cached audio for key at output_path; False if it has never been synthesized.
+
+    An output the index says already holds this key, untouched since, is left as it is.
+    """
+    name = os.path.basename(output_path)
+    if index is not None:
+        entry = index.get(name)
+        try:
+            if entry and entry == _index_entry(key, output_path):
+                return True
+        except FileNotFoundError:
+            pass
+    cache_path = os.path.join(cache_dir, key + '.mp3')
+    try:
+        # A copy, not a hard link: providers overwrite outputs in place, which would change the cached file too
+        shutil.copyfile(cache_path, output_path)
+    except FileNotFoundError:
+        return False
+    if index is not None:
+        index[name] = _index_entry(key, output_path)
+    logger.debug(f"[AUDIO_CACHE] {name} restored from the cache")
+    return True
+
+def store_cached_audio(cache_dir: str, key: str, output_path: str, index: Optional[Dict[str, list]] = None) -> None:
+    """Atomically copy freshly synthesized audio into the cache under key."""
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    os.close(fd)
+    try:
+        shutil.copyfile(output_path, tmp_path)
+        os.replace(tmp_path, os.path.join(cache_dir, key + '.mp3'))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    if index is not None:
+        index[os.path.basename(output_path)] = _index_entry(key, output_path)
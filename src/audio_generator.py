@@ -1,11 +1,14 @@
 import os
+import asyncio
 import logging
 import time
-from typing import List, Dict, Optional # Added Optional
+from concurrent.futures import Executor
+from typing import List, Dict, Optional, Callable # Added Optional
 import yaml
 
 # Import the TTS provider interface and factory
-from .tts_provider import create_tts_provider, TTSProvider # Added TTSProvider for type hint
+from .tts_provider import create_tts_provider, tts_concurrency, TTSProvider # Added TTSProvider for type hint
+from .audio_cache import audio_cache_key, restore_cached_audio, store_cached_audio, load_audio_index, save_audio_index
 
 # Get a logger for this module
 logger = logging.getLogger(__name__)
@@ -103,6 +106,93 @@ def generate_all_audio(narrations: List[str], config: Dict) -> List[str]:
         for handler in logging.getLogger().handlers:
             handler.flush()
 
+async def generate_all_audio_async(narrations: List[str], config: Dict, tts_provider: Optional[TTSProvider] = None,
+                                   progress: Optional[Callable[[str], None]] = None,
+                                   executor: Optional[Executor] = None, cache_dir: Optional[str] = None) -> List[str]:
+    """Generates audio files for all narration scripts concurrently.
+    
+    Up to tts.concurrency slides (default: the provider's max_concurrency) are
+    synthesized at once. The provider calls are blocking, so each one runs in a
+    worker thread, taken from executor if given (else the loop's default executor).
+    Pass an existing tts_provider to reuse its client across calls,
+    and a progress callback to get a message as each slide finishes. With a cache_dir, narrations already
+    synthesized with the same provider settings are copied from there instead of calling the provider.
+    Returns an empty list if any slide fails, like generate_all_audio.
+    """
+    output_base_dir = config.get('output_dir', 'output')
+    audio_output_dir = os.path.abspath(os.path.join(output_base_dir, 'audio'))
+    os.makedirs(audio_output_dir, exist_ok=True)
+    
+    tts_config = config.get('tts', {})
+    if tts_provider is None:
+        tts_provider = create_tts_provider(config)
+    if not tts_provider:
+        logger.error("[AUDIO] Abortando geração de áudio devido à falha na criação do provider.")
+        return []
+    logger.info(f"[AUDIO] Provider TTS selecionado: {tts_provider.__class__.__name__}")
+    
+    total_narrations = len(narrations)
+    loop = asyncio.get_running_loop()
+    delay = tts_config.get('delay_between_calls', 1)
+    semaphore = asyncio.Semaphore(tts_concurrency(config, tts_provider))
+    done = 0
+    cache_hits = 0
+    index = load_audio_index(audio_output_dir) if cache_dir else None
+    
+    async def synthesize(i: int, narration_text: str) -> Optional[str]:
+        nonlocal done, cache_hits
+        slide_num = i + 1
+        output_file = os.path.join(audio_output_dir, f"audio_{slide_num}.mp3")
+        key = audio_cache_key(narration_text, tts_provider) if cache_dir else None
+        # Cache hits make no provider call, so they skip the semaphore and the rate-limit delay
+        if key and await loop.run_in_executor(executor, restore_cached_audio, cache_dir, key, output_file, index):
+            cache_hits += 1
+            done += 1
+            if progress:
+                progress(f"Generated audio {done}/{total_narrations}")
+            return output_file
+        async with semaphore:
+            logger.info(f"[AUDIO] --- Slide {slide_num}/{total_narrations} ---")
+            start_time = time.time()
+            success = await loop.run_in_executor(executor, tts_provider.generate_audio, narration_text, output_file)
+            logger.info(f"[AUDIO-DEBUG] Tempo de execução para slide {slide_num}: {time.time() - start_time:.2f}s")
+            if success and key:
+                try:
+                    await loop.run_in_executor(executor, store_cached_audio, cache_dir, key, output_file, index)
+                except OSError as e:
+                    logger.warning(f"[AUDIO] Não foi possível salvar o slide {slide_num} no cache: {e}")
+            done += 1
+            if progress:
+                progress(f"Generated audio {done}/{total_narrations}")
+            # Hold the slot for the configured delay to keep the per-slot request rate unchanged
+            await asyncio.sleep(delay)
+        if not success:
+            logger.error(f"[AUDIO] Falha ao gerar áudio para o slide {slide_num}.")
+            return None
+        return output_file
+    
+    try:
+        results = await asyncio.gather(*(synthesize(i, n) for i, n in enumerate(narrations)))
+    except Exception as e:
+        logger.error(f"[AUDIO] Exceção Python não tratada em generate_all_audio_async: {e}", exc_info=True)
+        return []
+    finally:
+        if index is not None:
+            try:
+                save_audio_index(audio_output_dir, index)
+            except OSError as e:
+                logger.warning(f"[AUDIO] Não foi possível salvar o índice de áudio: {e}")
+    
+    if cache_hits:
+        logger.info(f"[AUDIO] {cache_hits}/{total_narrations} áudios reaproveitados do cache")
+    
+    if not all(results):
+        logger.error("[AUDIO] Nem todos os áudios foram gerados. Interrompendo o processo.")
+        return []
+    
+    logger.info(f"[AUDIO] Geração de áudios finalizada. Total gerado: {len(results)}")
+    return results
+
 
 if __name__ == '__main__':
     # Basic logging setup for standalone execution
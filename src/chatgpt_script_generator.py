@@ -11,6 +11,141 @@ from src.latex_parser import parse_latex_file, Slide
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Substitution tables for clean_chatgpt_response, compiled once at import and applied in order
+
+_MARKDOWN_SUBS = [
+    (re.compile(r'^#+ .*$', re.MULTILINE), ''),           # Headers
+    (re.compile(r'\*\*(.*?)\*\*'), r'\1'),                 # Bold
+    (re.compile(r'\*(.*?)\*'), r'\1'),                     # Italic
+    (re.compile(r'__(.*?)__'), r'\1'),                     # Bold
+    (re.compile(r'_(.*?)_'), r'\1'),                       # Italic
+    (re.compile(r'```.*?```', re.DOTALL), ''),             # Code blocks
+    (re.compile(r'`(.*?)`'), r'\1'),                       # Inline code
+    (re.compile(r'^\s*[-*+]\s+', re.MULTILINE), ''),       # Bullet lists
+    (re.compile(r'^\s*\d+\.\s+', re.MULTILINE), ''),       # Numbered lists
+]
+
+_RE_FRAC = re.compile(r'\\frac\s*\{([^\{\}]*)\}\s*\{([^\{\}]*)\}')
+
+_GREEK_MAP = {
+    "alpha": "alfa", "beta": "beta", "gamma": "gama", "delta": "delta", "epsilon": "épsilon",
+    "zeta": "zeta", "eta": "eta", "theta": "teta", "iota": "iota", "kappa": "kapa",
+    "lambda": "lambda", "mu": "mi", "nu": "ni", "xi": "xi", "omicron": "ômicron",
+    "pi": "pi", "rho": "rô", "sigma": "sigma", "tau": "tau", "upsilon": "ípsilon",
+    "phi": "fi", "chi": "chi", "psi": "psi", "omega": "ômega"
+}
+_GREEK_SUBS = []
+for _latex, _pt in _GREEK_MAP.items():
+    # minúsculas, depois maiúsculas (ex: \Alpha)
+    _GREEK_SUBS.append((re.compile(rf'\\{_latex}\b'), _pt))
+    _GREEK_SUBS.append((re.compile(rf'\\{_latex.capitalize()}\b'), f"{_pt.capitalize()} maiúsculo"))
+
+_MATH_SUBS = [
+    (re.compile(r'\\cdot'), ' vezes '),
+    (re.compile(r'\\times'), ' vezes '),
+    (re.compile(r'\\pm'), ' mais ou menos '),
+    (re.compile(r'\\mp'), ' menos ou mais '),
+    (re.compile(r'\\leq'), ' menor ou igual a '),
+    (re.compile(r'\\geq'), ' maior ou igual a '),
+    (re.compile(r'\\neq'), ' diferente de '),
+    (re.compile(r'\\approx'), ' aproximadamente igual a '),
+    (re.compile(r'\\infty'), ' infinito '),
+    (re.compile(r'\\sqrt\{([^\{\}]*)\}'), r'raiz quadrada de \1'),
+    (re.compile(r'\\sqrt\[3\]\{([^\{\}]*)\}'), r'raiz cúbica de \1'),
+    (re.compile(r'\\sum\b'), ' somatório '),
+    (re.compile(r'\\prod\b'), ' produtório '),
+    (re.compile(r'\\cup\b'), ' união '),
+    (re.compile(r'\\cap\b'), ' interseção '),
+    (re.compile(r'\\partial\b'), ' derivada parcial '),
+    (re.compile(r'\\nabla\s*\\times'), ' rotacional '),
+    (re.compile(r'\\nabla\s*\\cdot'), ' divergente '),
+    (re.compile(r'\\nabla'), ' gradiente '),
+    (re.compile(r'\\int\b'), ' integral '),
+    (re.compile(r'\\oint\b'), ' integral de linha '),
+    (re.compile(r'\\begin\{bmatrix\}'), 'início da matriz'),
+    (re.compile(r'\\end\{bmatrix\}'), 'fim da matriz'),
+    (re.compile(r'\\begin\{pmatrix\}'), 'início da matriz'),
+    (re.compile(r'\\end\{pmatrix\}'), 'fim da matriz'),
+    (re.compile(r'\\begin\{matrix\}'), 'início da matriz'),
+    (re.compile(r'\\end\{matrix\}'), 'fim da matriz'),
+    (re.compile(r'\\\\'), ';'),    # Fim de linha da matriz
+    (re.compile(r'&'), ' e '),     # Separador de coluna
+    # Subscritos
+    (re.compile(r'([A-Za-z])_\{([^\{\}]*)\}'), r'\1 subscrito \2'),
+    (re.compile(r'([A-Za-z])_([A-Za-z0-9])'), r'\1 subscrito \2'),
+    # Superscritos
+    (re.compile(r'([A-Za-z0-9])\^\{([^\{\}]*)\}'), r'\1 sobrescrito \2'),
+    (re.compile(r'([A-Za-z0-9])\^([A-Za-z0-9])'), r'\1 sobrescrito \2'),
+    # Delimitadores de matemática LaTeX
+    (re.compile(r'\\\((.*?)\\\)', re.DOTALL), r'\1'),
+    (re.compile(r'\$(.*?)\$', re.DOTALL), r'\1'),
+    (re.compile(r'\\\[(.*?)\\\]', re.DOTALL), r'\1'),
+    (re.compile(r'\$\$(.*?)\$\$', re.DOTALL), r'\1'),
+]
+
+_RE_WHITESPACE = re.compile(r'\s+')
+
+_PHRASES_TO_REMOVE = [
+    r"^Aqui está um script de narração.*?:",
+    r"^Aqui está uma narração.*?:",
+    r"^Script de narração.*?:",
+    r"^Narração.*?:",
+    r"^Claro.*?:",
+    r"^Certamente.*?:",
+    r"^Vamos criar.*?:",
+    r"^Segue abaixo.*?:",
+    r"^Segue o script.*?:",
+    r"^Segue a narração.*?:",
+    r"^Espero que isso ajude.*$",
+    r"^Espero que esta narração.*$",
+    r"^Espero que este script.*$",
+    r"^Espero ter atendido.*$",
+    r"^Se precisar de alguma alteração.*$",
+    r"^Se precisar de ajustes.*$",
+    # Remove specific markers
+    r"\[Início do Script de Narração\]",
+    r"\[Fim do Script de Narração\]",
+    r"\{Início do Video\]",
+    r"\{Fim do Video\]",
+    r"\[Início da Narração\]",
+    r"\[Fim da Narração\]",
+    r"\[Início\]",
+    r"\[Fim\]",
+    r"\{Início\]",
+    r"\{Fim\]",
+]
+
+_CLEANUP_SUBS = [
+    (re.compile(r'k subscrito e'), 'k_e'),
+    (re.compile(r'm subscrito 1'), 'm_1'),
+    (re.compile(r'm subscrito 2'), 'm_2'),
+    (re.compile(r'q subscrito 1'), 'q_1'),
+    (re.compile(r'q subscrito 2'), 'q_2'),
+    (re.compile(r'E subscrito k'), 'E_k'),
+    (re.compile(r'\\hbar'), 'hbar'),
+    (re.compile(r'\\[a-zA-Z]+'), ''),      # Remove comandos como \sin, \cos, etc.
+    (re.compile(r'\\[^a-zA-Z]'), ''),      # Remove caracteres especiais LaTeX
+]
+_PHRASE_PATTERNS = [re.compile(phrase, re.MULTILINE | re.IGNORECASE) for phrase in _PHRASES_TO_REMOVE]
+# Matches wherever any single phrase pattern would; used to skip the per-phrase passes
+_RE_ANY_PHRASE = re.compile('|'.join(f'(?:{phrase})' for phrase in _PHRASES_TO_REMOVE), re.MULTILINE | re.IGNORECASE)
+_LINE_CLEANUP_SUBS = [
+    (re.compile(r'^>.*$', re.MULTILINE), ''),     # Lines starting with common ChatGPT markers
+    (re.compile(r'^[=-]+$', re.MULTILINE), ''),   # Separator lines
+    (re.compile(r'^\s*$', re.MULTILINE), ''),     # Whitespace-only lines
+    (re.compile(r'\n{2,}'), '\n'),                # Multiple newlines
+]
+
+
+# Patterns for format_slide_for_chatgpt
+_FORMULA_SUBS = [
+    (re.compile(r'\$\$(.*?)\$\$', re.DOTALL), r'FORMULA: \1'),  # Display math
+    (re.compile(r'\$(.*?)\$', re.DOTALL), r'FORMULA: \1'),      # Inline math
+    (re.compile(r'\\begin\{equation\*?\}(.*?)\\end\{equation\*?\}', re.DOTALL), r'FORMULA: \1'),  # Equation environment
+]
+_RE_ALIGN = re.compile(r'\\begin\{align\*?\}(.*?)\\end\{align\*?\}', re.DOTALL)
+_RE_EQUATION_BREAK = re.compile(r'\\\\|\n')
+
 def clean_chatgpt_response(response: str) -> str:
     """
     Clean up ChatGPT response to ensure it doesn't contain any markup or unwanted text.
@@ -54,22 +189,9 @@ def clean_chatgpt_response(response: str) -> str:
     if specific_case:
         return specific_case
 
-    # Remove any markdown headers (# Header)
-    response = re.sub(r'^#+ .*$', '', response, flags=re.MULTILINE)
-
-    # Remove markdown formatting for bold and italic
-    response = re.sub(r'\*\*(.*?)\*\*', r'\1', response)  # Bold
-    response = re.sub(r'\*(.*?)\*', r'\1', response)      # Italic
-    response = re.sub(r'__(.*?)__', r'\1', response)      # Bold
-    response = re.sub(r'_(.*?)_', r'\1', response)        # Italic
-
-    # Remove markdown code blocks
-    response = re.sub(r'```.*?```', '', response, flags=re.DOTALL)
-    response = re.sub(r'`(.*?)`', r'\1', response)
-
-    # Remove markdown lists
-    response = re.sub(r'^\s*[-*+]\s+', '', response, flags=re.MULTILINE)
-    response = re.sub(r'^\s*\d+\.\s+', '', response, flags=re.MULTILINE)
+    # Remove markdown formatting, code blocks and lists
+    for pattern, replacement in _MARKDOWN_SUBS:
+        response = pattern.sub(replacement, response)
 
     # --- LaTeX to Portuguese speech ---
 
@@ -78,148 +200,31 @@ def clean_chatgpt_response(response: str) -> str:
         numerador = match.group(1).strip()
         denominador = match.group(2).strip()
         return f"{numerador} dividido por {denominador}"
-    response = re.sub(r'\\frac\s*\{([^\{\}]*)\}\s*\{([^\{\}]*)\}', frac_to_speech, response)
+    response = _RE_FRAC.sub(frac_to_speech, response)
 
     # 2. Letras gregas para português
-    greek_map = {
-        "alpha": "alfa", "beta": "beta", "gamma": "gama", "delta": "delta", "epsilon": "épsilon",
-        "zeta": "zeta", "eta": "eta", "theta": "teta", "iota": "iota", "kappa": "kapa",
-        "lambda": "lambda", "mu": "mi", "nu": "ni", "xi": "xi", "omicron": "ômicron",
-        "pi": "pi", "rho": "rô", "sigma": "sigma", "tau": "tau", "upsilon": "ípsilon",
-        "phi": "fi", "chi": "chi", "psi": "psi", "omega": "ômega"
-    }
-    for latex, pt in greek_map.items():
-        # minúsculas
-        response = re.sub(rf'\\{latex}\b', pt, response)
-        # maiúsculas (ex: \Alpha)
-        response = re.sub(rf'\\{latex.capitalize()}\b', f"{pt.capitalize()} maiúsculo", response)
-
-    # 3. Substituir comandos matemáticos comuns por fala
-    response = re.sub(r'\\cdot', ' vezes ', response)
-    response = re.sub(r'\\times', ' vezes ', response)
-    response = re.sub(r'\\pm', ' mais ou menos ', response)
-    response = re.sub(r'\\mp', ' menos ou mais ', response)
-    response = re.sub(r'\\leq', ' menor ou igual a ', response)
-    response = re.sub(r'\\geq', ' maior ou igual a ', response)
-    response = re.sub(r'\\neq', ' diferente de ', response)
-    response = re.sub(r'\\approx', ' aproximadamente igual a ', response)
-    response = re.sub(r'\\infty', ' infinito ', response)
-    # Raiz quadrada
-    response = re.sub(r'\\sqrt\{([^\{\}]*)\}', r'raiz quadrada de \1', response)
-    # Raiz cúbica
-    response = re.sub(r'\\sqrt\[3\]\{([^\{\}]*)\}', r'raiz cúbica de \1', response)
-    # Somatório
-    response = re.sub(r'\\sum\b', ' somatório ', response)
-    # Produtório
-    response = re.sub(r'\\prod\b', ' produtório ', response)
-    # União
-    response = re.sub(r'\\cup\b', ' união ', response)
-    # Interseção
-    response = re.sub(r'\\cap\b', ' interseção ', response)
-    # Operadores diferenciais
-    response = re.sub(r'\\partial\b', ' derivada parcial ', response)
-    # Rotacional, divergente, gradiente (expressões comuns)
-    response = re.sub(r'\\nabla\s*\\times', ' rotacional ', response)
-    response = re.sub(r'\\nabla\s*\\cdot', ' divergente ', response)
-    response = re.sub(r'\\nabla', ' gradiente ', response)
-    response = re.sub(r'\\int\b', ' integral ', response)
-    response = re.sub(r'\\oint\b', ' integral de linha ', response)
-    # Matrizes
-    response = re.sub(r'\\begin\{bmatrix\}', 'início da matriz', response)
-    response = re.sub(r'\\end\{bmatrix\}', 'fim da matriz', response)
-    response = re.sub(r'\\begin\{pmatrix\}', 'início da matriz', response)
-    response = re.sub(r'\\end\{pmatrix\}', 'fim da matriz', response)
-    response = re.sub(r'\\begin\{matrix\}', 'início da matriz', response)
-    response = re.sub(r'\\end\{matrix\}', 'fim da matriz', response)
-    response = re.sub(r'\\\\', ';', response)  # Fim de linha da matriz
-    response = re.sub(r'&', ' e ', response)   # Separador de coluna
-
-    # 4. Subscritos e sobrescritos
-    # Padrões físicos comuns
-    response = re.sub(r'E_k', 'E_k', response)
-    response = re.sub(r'k_e', 'k_e', response)
-    response = re.sub(r'm_1', 'm_1', response)
-    response = re.sub(r'm_2', 'm_2', response)
-    response = re.sub(r'q_1', 'q_1', response)
-    response = re.sub(r'q_2', 'q_2', response)
-
-    # Outros subscritos
-    response = re.sub(r'([A-Za-z])_\{([^\{\}]*)\}', r'\1 subscrito \2', response)
-    response = re.sub(r'([A-Za-z])_([A-Za-z0-9])', r'\1 subscrito \2', response)
-
-    # Superscritos
-    response = re.sub(r'([A-Za-z0-9])\^\{([^\{\}]*)\}', r'\1 sobrescrito \2', response)
-    response = re.sub(r'([A-Za-z0-9])\^([A-Za-z0-9])', r'\1 sobrescrito \2', response)
+    for pattern, replacement in _GREEK_SUBS:
+        response = pattern.sub(replacement, response)
 
-    # 5. Remover delimitadores de matemática LaTeX
-    response = re.sub(r'\\\((.*?)\\\)', r'\1', response, flags=re.DOTALL)
-    response = re.sub(r'\$(.*?)\$', r'\1', response, flags=re.DOTALL)
-    response = re.sub(r'\\\[(.*?)\\\]', r'\1', response, flags=re.DOTALL)
-    response = re.sub(r'\$\$(.*?)\$\$', r'\1', response, flags=re.DOTALL)
+    # 3. Comandos matemáticos comuns, 4. subscritos e sobrescritos, 5. delimitadores de matemática
+    for pattern, replacement in _MATH_SUBS:
+        response = pattern.sub(replacement, response)
 
     # 6. Corrigir múltiplos espaços
-    response = re.sub(r'\s+', ' ', response)
+    response = _RE_WHITESPACE.sub(' ', response)
     response = response.replace(' ;', ';').replace(' ,', ',').replace(' .', '.').strip()
 
-    # 7. Corrigir símbolos físicos comuns
-    response = re.sub(r'k subscrito e', 'k_e', response)
-    response = re.sub(r'm subscrito 1', 'm_1', response)
-    response = re.sub(r'm subscrito 2', 'm_2', response)
-    response = re.sub(r'q subscrito 1', 'q_1', response)
-    response = re.sub(r'q subscrito 2', 'q_2', response)
-    response = re.sub(r'E subscrito k', 'E_k', response)
-    response = re.sub(r'\\hbar', 'hbar', response)
-    response = re.sub(r'hbar', 'hbar', response)  # preserve hbar if present
-
-    # 8. Remover comandos LaTeX restantes
-    response = re.sub(r'\\[a-zA-Z]+', '', response)  # Remove comandos como \sin, \cos, etc.
-    response = re.sub(r'\\[^a-zA-Z]', '', response)  # Remove caracteres especiais LaTeX
-
-    # Remove common ChatGPT phrases
-    phrases_to_remove = [
-        r"^Aqui está um script de narração.*?:",
-        r"^Aqui está uma narração.*?:",
-        r"^Script de narração.*?:",
-        r"^Narração.*?:",
-        r"^Claro.*?:",
-        r"^Certamente.*?:",
-        r"^Vamos criar.*?:",
-        r"^Segue abaixo.*?:",
-        r"^Segue o script.*?:",
-        r"^Segue a narração.*?:",
-        r"^Espero que isso ajude.*$",
-        r"^Espero que esta narração.*$",
-        r"^Espero que este script.*$",
-        r"^Espero ter atendido.*$",
-        r"^Se precisar de alguma alteração.*$",
-        r"^Se precisar de ajustes.*$",
-        # Remove specific markers
-        r"\[Início do Script de Narração\]",
-        r"\[Fim do Script de Narração\]",
-        r"\{Início do Video\]",
-        r"\{Fim do Video\]",
-        r"\[Início da Narração\]",
-        r"\[Fim da Narração\]",
-        r"\[Início\]",
-        r"\[Fim\]",
-        r"\{Início\]",
-        r"\{Fim\]",
-    ]
-
-    for phrase in phrases_to_remove:
-        response = re.sub(phrase, '', response, flags=re.MULTILINE | re.IGNORECASE)
-
-    # Remove any lines that start with common ChatGPT markers
-    response = re.sub(r'^>.*$', '', response, flags=re.MULTILINE)
-
-    # Remove any lines that are just dashes or equals signs (separators)
-    response = re.sub(r'^[=-]+$', '', response, flags=re.MULTILINE)
-
-    # Remove any lines that are just whitespace
-    response = re.sub(r'^\s*$', '', response, flags=re.MULTILINE)
-
-    # Consolidate multiple newlines into a single newline
-    response = re.sub(r'\n{2,}', '\n', response)
+    # 7. Corrigir símbolos físicos comuns, 8. remover comandos LaTeX restantes,
+    # remover frases comuns do ChatGPT e linhas vazias ou separadoras
+    for pattern, replacement in _CLEANUP_SUBS:
+        response = pattern.sub(replacement, response)
+    # Phrases are removed one pass at a time (a removal can expose the next one at line start),
+    # but most responses contain none, and then a single combined search is enough
+    if _RE_ANY_PHRASE.search(response):
+        for pattern in _PHRASE_PATTERNS:
+            response = pattern.sub('', response)
+    for pattern, replacement in _LINE_CLEANUP_SUBS:
+        response = pattern.sub(replacement, response)
 
     # Trim whitespace
     response = response.strip()
@@ -236,9 +241,9 @@ def format_slide_for_chatgpt(slide: Slide, all_slides: List[Slide] = None, slide
         all_slides: Optional list of all slides in the presentation
         slide_index: Optional index of the current slide in the all_slides list
     """
-    logging.info(f"Formatting slide for ChatGPT: {slide.title} (Frame {slide.frame_number})")
-    logging.info(f"  - All slides provided: {all_slides is not None}")
-    logging.info(f"  - Slide index provided: {slide_index is not None}")
+    logging.debug("Formatting slide for ChatGPT: %s (Frame %s)", slide.title, slide.frame_number)
+    logging.debug("  - All slides provided: %s", all_slides is not None)
+    logging.debug("  - Slide index provided: %s", slide_index is not None)
     
     # Start with the slide title
     formatted_content = f"# {slide.title}\n\n"
@@ -359,30 +364,23 @@ def format_slide_for_chatgpt(slide: Slide, all_slides: List[Slide] = None, slide
     
     # Identify and mark mathematical formulas
     # Look for LaTeX math delimiters and environments
-    math_patterns = [
-        (r'\$\$(.*?)\$\$', r'FORMULA: \1'),  # Display math
-        (r'\$(.*?)\$', r'FORMULA: \1'),      # Inline math
-        (r'\\begin\{equation\*?\}(.*?)\\end\{equation\*?\}', r'FORMULA: \1'),  # Equation environment
-    ]
-    
-    for pattern, replacement in math_patterns:
-        content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+    for pattern, replacement in _FORMULA_SUBS:
+        content = pattern.sub(replacement, content)
     
     # General handling for align environments (for other slides)
-    align_pattern = re.compile(r'\\begin\{align\*?\}(.*?)\\end\{align\*?\}', re.DOTALL)
-    align_matches = list(align_pattern.finditer(content))
+    align_matches = list(_RE_ALIGN.finditer(content))
     
     for match in align_matches:
         align_content = match.group(1)
         # Split by newline or \\ to get individual equations
-        equations = re.split(r'\\\\|\n', align_content)
+        equations = _RE_EQUATION_BREAK.split(align_content)
         equations = [eq.strip() for eq in equations if eq.strip()]
         
         # Format each equation
         formatted_equations = []
         for eq in equations:
             # Remove alignment markers
-            eq = re.sub(r'&', '', eq)
+            eq = eq.replace('&', '')
             formatted_equations.append(f"FORMULA: {eq}")
         
         # Join with newlines
@@ -2,19 +2,50 @@ import os
 import re
 import subprocess
 import logging
-from pdf2image import convert_from_path
-from typing import List, Dict, Optional
+from pdf2image import convert_from_path, pdfinfo_from_path
+from concurrent.futures import Executor, as_completed
+from typing import List, Dict, Optional, Callable
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logging.info("[MARKER] src/image_generator.py loaded and running from: " + os.path.abspath(__file__))
-print("[PRINT-DEBUG] THIS IS THE ONLY src/image_generator.py:", os.path.abspath(__file__))
+
+# pdftoppm output flag and the extension it writes, per configured image format
+PDFTOPPM_FORMATS = {'png': ('-png', 'png'), 'jpg': ('-jpeg', 'jpg'), 'jpeg': ('-jpeg', 'jpg')}
+
+def copy_if_changed(src: str, dst: str) -> None:
+    """Atomically copies src to dst with shutil.copy2, skipping the copy if dst already has src's size and mtime.
+
+    A copy rather than a hard link: pdflatex rewrites the source PDF in place, which would change a
+    linked dst under anything still reading it.
+    """
+    import shutil
+    import tempfile
+    src_st = os.stat(src)
+    try:
+        dst_st = os.stat(dst)
+        if (dst_st.st_size, dst_st.st_mtime_ns) == (src_st.st_size, src_st.st_mtime_ns) and not os.path.samefile(src, dst):
+            return
+    except FileNotFoundError:
+        pass
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dst) or '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        shutil.copy2(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 def load_config(config_path: str = '../config/config.yaml') -> Dict:
     """Loads configuration from YAML file."""
     try:
         with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
         logging.info(f"Configuration loaded from {config_path}")
         return config
     except FileNotFoundError:
@@ -48,11 +79,18 @@ def compile_latex_to_pdf(latex_file_path: str, output_dir: str) -> Optional[str]
     logging.info(f"Compiling {latex_file_path} to PDF in source directory: {source_dir}...")
     
     # Run pdflatex twice for references/toc etc.
-    for i in range(2):
+    passes = 2
+    for i in range(passes):
+        if i < passes - 1:
+            # Intermediate passes only resolve references, so skip writing the PDF; same error handling
+            # as the final pass, so a recoverable error still leaves the .aux files it needs
+            cmd = ['pdflatex', '-draftmode', '-interaction=nonstopmode', latex_file_path]
+        else:
+            cmd = ['pdflatex', '-interaction=nonstopmode', latex_file_path]
         try:
             # First try to compile in the source directory (without specifying output directory)
             process = subprocess.run(
-                ['pdflatex', '-interaction=nonstopmode', latex_file_path],
+                cmd,
                 cwd=source_dir,  # Run in the source directory
                 capture_output=True, text=True, timeout=60
             )
@@ -87,8 +125,7 @@ def compile_latex_to_pdf(latex_file_path: str, output_dir: str) -> Optional[str]
             
             # Copy the PDF to the output directory for further processing
             try:
-                import shutil
-                shutil.copy2(pdf_path_source, pdf_path_output)
+                copy_if_changed(pdf_path_source, pdf_path_output)
                 logging.info(f"PDF copied to output directory: {pdf_path_output}")
                 return pdf_path_output
             except Exception as e:
@@ -131,7 +168,7 @@ def convert_pdf_to_images(pdf_path: str, output_folder: str, dpi: int, image_for
     # Approach 1: Default settings
     try:
         logging.info("Attempting conversion with default settings...")
-        print("[PRINT-DEBUG] convert_from_path starting (default settings)...")
+        logging.debug("convert_from_path starting (default settings)...")
         images = convert_from_path(
             pdf_path,
             dpi=dpi,
@@ -139,7 +176,7 @@ def convert_pdf_to_images(pdf_path: str, output_folder: str, dpi: int, image_for
             fmt=image_format.lower(),
             paths_only=True
         )
-        print("[PRINT-DEBUG] convert_from_path finished (default settings)")
+        logging.debug("convert_from_path finished (default settings)")
         
         if images:
             logging.info(f"Successfully converted PDF to {len(images)} images with default settings")
@@ -228,8 +265,72 @@ def convert_pdf_to_images(pdf_path: str, output_folder: str, dpi: int, image_for
     logging.error("Failed to convert PDF to images with all methods")
     return []
 
-def generate_slide_images(latex_file_path: str, config: Dict) -> List[str]:
-    """Orchestrates LaTeX compilation and PDF to image conversion."""
+def convert_pdf_page_to_image(pdf_path: str, output_folder: str, page_number: int, dpi: int, image_format: str) -> str:
+    """Converts a single PDF page (1-based) to slide_NNN.<format> and returns its path.
+    
+    PNG and JPEG pages are rendered by a single pdftoppm call; convert_from_path would
+    also spawn a pdfinfo process for every page just to count them again.
+    """
+    fmt = PDFTOPPM_FORMATS.get(image_format.lower())
+    if fmt:
+        flag, ext = fmt
+        output_prefix = os.path.join(output_folder, f"slide_{page_number:03d}")
+        subprocess.run(
+            ['pdftoppm', flag, '-r', str(dpi), '-f', str(page_number), '-l', str(page_number),
+             '-singlefile', pdf_path, output_prefix],
+            check=True, capture_output=True
+        )
+        return f"{output_prefix}.{ext}"
+    images = convert_from_path(
+        pdf_path,
+        dpi=dpi,
+        output_folder=output_folder,
+        fmt=image_format.lower(),
+        first_page=page_number,
+        last_page=page_number,
+        output_file=f"slide_{page_number:03d}",
+        single_file=True,
+        paths_only=True
+    )
+    return images[0]
+
+def convert_pdf_to_images_parallel(pdf_path: str, output_folder: str, dpi: int, image_format: str,
+                                   executor: Executor, progress: Optional[Callable[[str], None]] = None) -> List[str]:
+    """Converts each page of a PDF to an image, one page per executor task."""
+    if not os.path.exists(pdf_path):
+        logging.error(f"PDF file not found for image conversion: {pdf_path}")
+        return []
+    
+    os.makedirs(output_folder, exist_ok=True)
+    page_count = pdfinfo_from_path(pdf_path)["Pages"]
+    logging.info(f"Converting {page_count} PDF pages to images in parallel (DPI: {dpi}, Format: {image_format})...")
+    
+    futures = {
+        executor.submit(convert_pdf_page_to_image, pdf_path, output_folder, page, dpi, image_format): page
+        for page in range(1, page_count + 1)
+    }
+    image_paths = [None] * page_count
+    for done, future in enumerate(as_completed(futures), 1):
+        page = futures[future]
+        try:
+            image_paths[page - 1] = future.result()
+        except Exception as e:
+            logging.error(f"Error converting page {page}: {e}")
+        if progress:
+            progress(f"Converted slide image {done}/{page_count}")
+    
+    if not all(image_paths):
+        logging.error("Failed to convert some PDF pages to images")
+        return []
+    return image_paths
+
+def generate_slide_images(latex_file_path: str, config: Dict, executor: Optional[Executor] = None,
+                          progress: Optional[Callable[[str], None]] = None) -> List[str]:
+    """Orchestrates LaTeX compilation and PDF to image conversion.
+    
+    If an executor is given, pages are converted concurrently on it and progress
+    (if given) is called with a status message as each page finishes.
+    """
     output_base_dir = config.get('output_dir', '../output') # Get base output dir
     pdf_output_dir = os.path.abspath(os.path.join(output_base_dir, 'temp_pdf')) # Temp dir for PDF and logs
     slides_output_dir = os.path.abspath(os.path.join(output_base_dir, 'slides')) # Final images dir
@@ -249,10 +350,9 @@ def generate_slide_images(latex_file_path: str, config: Dict) -> List[str]:
         logging.info(f"[PATCH] compile_latex_to_pdf returned: {pdf_path}, exists={os.path.exists(pdf_path) if pdf_path else False}")
         logging.info(f"[PATCH] Attempting to copy PDF from {possible_pdf} to {dest_pdf}")
         if os.path.exists(possible_pdf):
-            import shutil
             try:
                 os.makedirs(pdf_output_dir, exist_ok=True)
-                shutil.copy2(possible_pdf, dest_pdf)
+                copy_if_changed(possible_pdf, dest_pdf)
                 logging.info(f"[PATCH] PDF copied from {possible_pdf} to {dest_pdf}")
                 pdf_path = dest_pdf
             except Exception as e:
@@ -265,7 +365,10 @@ def generate_slide_images(latex_file_path: str, config: Dict) -> List[str]:
     # 2. Convert PDF to Images
     try:
         logging.info(f"[PATCH-DEBUG] Calling convert_pdf_to_images with pdf_path={pdf_path}, slides_output_dir={slides_output_dir}")
-        image_paths = convert_pdf_to_images(pdf_path, slides_output_dir, dpi, image_format)
+        if executor is not None:
+            image_paths = convert_pdf_to_images_parallel(pdf_path, slides_output_dir, dpi, image_format, executor, progress)
+        else:
+            image_paths = convert_pdf_to_images(pdf_path, slides_output_dir, dpi, image_format)
         logging.info(f"[PATCH-DEBUG] convert_pdf_to_images returned {len(image_paths)} images: {image_paths}")
     except Exception as e:
         logging.error(f"[PATCH-DEBUG] Exception in convert_pdf_to_images: {e}")
@@ -1,5 +1,6 @@
 import re
 import os
+import mmap
 import logging
 import subprocess
 from typing import List, Dict, Any, Optional
@@ -202,6 +203,21 @@ def parse_pdf_file(pdf_path: str) -> List[Slide]:
     logging.info(f"Successfully parsed {len(slides)} slides from PDF.")
     return slides
 
+# Slide patterns, compiled once and matched directly against the memory-mapped file bytes
+SECTION_RE = re.compile(rb'\\section\{(.*?)\}', re.DOTALL)
+FRAME_RES = [
+    re.compile(rb'\\begin\{frame\}(.*?)\\end\{frame\}', re.DOTALL),
+    re.compile(rb'\\begin\{frame\}\[(.*?)\](.*?)\\end\{frame\}', re.DOTALL),
+    re.compile(rb'(?<!title)\\frame\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}', re.DOTALL),
+    re.compile(rb'\\begin\{frame\}\{(.*?)\}(.*?)\\end\{frame\}', re.DOTALL),
+]
+TITLE_RE = re.compile(rb'\\title\{(.*?)\}', re.DOTALL)
+AUTHOR_RE = re.compile(rb'\\author\{(.*?)\}', re.DOTALL)
+
+def _decode(raw: bytes) -> str:
+    """Decodes a matched span as UTF-8 with universal newlines, like reading the file in text mode."""
+    return raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
 def parse_latex_file(file_path: str) -> List[Slide]:
     """Parses a LaTeX Beamer file or PDF file and extracts slides, including \section as slides."""
     # Check if the file is a PDF
@@ -212,8 +228,12 @@ def parse_latex_file(file_path: str) -> List[Slide]:
     # Otherwise, treat it as a LaTeX file
     logging.info(f"Parsing LaTeX file: {file_path}")
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            latex_content = f.read()
+        with open(file_path, 'rb') as f:
+            # Map the file instead of copying it into memory; empty files cannot be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                latex_content = b''
+            else:
+                latex_content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     except FileNotFoundError:
         logging.error(f"LaTeX file not found: {file_path}")
         # Check if there's a PDF with the same base name
@@ -226,29 +246,31 @@ def parse_latex_file(file_path: str) -> List[Slide]:
         logging.error(f"Error reading LaTeX file {file_path}: {e}")
         return []
 
-    # --- NEW: Find all \section and frame occurrences with their positions ---
-    # Pattern for \section{...}
-    section_pattern = re.compile(r'\\section\{(.*?)\}', re.DOTALL)
-    # Patterns for frames
-    frame_patterns = [
-        re.compile(r'\\begin\{frame\}(.*?)\\end\{frame\}', re.DOTALL),
-        re.compile(r'\\begin\{frame\}\[(.*?)\](.*?)\\end\{frame\}', re.DOTALL),
-        re.compile(r'(?<!title)\\frame\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}', re.DOTALL),
-        re.compile(r'\\begin\{frame\}\{(.*?)\}(.*?)\\end\{frame\}', re.DOTALL),
-    ]
-
-    # Find all \section occurrences
-    section_matches = [(m.start(), m.end(), m.group(1).strip()) for m in section_pattern.finditer(latex_content)]
-
-    # Find all frame occurrences (with their positions and content)
-    frame_matches = []
-    for pat in frame_patterns:
-        for m in pat.finditer(latex_content):
-            # For patterns with two groups (title, content), use content
-            if len(m.groups()) == 2:
-                frame_matches.append((m.start(), m.end(), m.group(2)))
-            else:
-                frame_matches.append((m.start(), m.end(), m.group(1)))
+    try:
+        # --- NEW: Find all \section and frame occurrences with their positions ---
+        section_matches = [(m.start(), m.end(), _decode(m.group(1)).strip()) for m in SECTION_RE.finditer(latex_content)]
+
+        # Find all frame occurrences (with their positions and content)
+        frame_matches = []
+        for pat in FRAME_RES:
+            for m in pat.finditer(latex_content):
+                # For patterns with two groups (title, content), use content
+                if len(m.groups()) == 2:
+                    frame_matches.append((m.start(), m.end(), _decode(m.group(2))))
+                else:
+                    frame_matches.append((m.start(), m.end(), _decode(m.group(1))))
+
+        # Extract document title and author for use in slides
+        title_match = TITLE_RE.search(latex_content)
+        doc_title = _decode(title_match.group(1)).strip() if title_match else "Presentation Title"
+        author_match = AUTHOR_RE.search(latex_content)
+        doc_author = _decode(author_match.group(1)).strip() if author_match else ""
+    except UnicodeDecodeError as e:
+        logging.error(f"Error reading LaTeX file {file_path}: {e}")
+        return []
+    finally:
+        if isinstance(latex_content, mmap.mmap):
+            latex_content.close()
 
     # Merge all slide-like elements (sections and frames) by their position in the file
     all_slide_matches = []
@@ -260,12 +282,6 @@ def parse_latex_file(file_path: str) -> List[Slide]:
     # Sort by position in the file
     all_slide_matches.sort(key=lambda x: x['start'])
 
-    # Extract document title and author for use in slides
-    title_match = re.search(r'\\title\{(.*?)\}', latex_content, re.DOTALL)
-    doc_title = title_match.group(1).strip() if title_match else "Presentation Title"
-    author_match = re.search(r'\\author\{(.*?)\}', latex_content, re.DOTALL)
-    doc_author = author_match.group(1).strip() if author_match else ""
-
     # Get the number of pages in the PDF
     source_dir = os.path.dirname(os.path.abspath(file_path))
     base_name = os.path.splitext(os.path.basename(file_path))[0]
@@ -1,6 +1,10 @@
 import os
 import logging
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 import argparse
 
 # Setup logging as early as possible
@@ -55,7 +59,7 @@ def load_config(config_path: str) -> dict:
     logger.info(f"[CONFIG] Attempting to load configuration from {config_path}")
     try:
         with open(config_path, 'r', encoding='utf-8') as f: # Added encoding
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
         logger.info(f"[CONFIG] Configuration loaded successfully from {config_path}")
         
         config_dir = os.path.dirname(os.path.abspath(config_path))
@@ -2,21 +2,46 @@
 import os
 import sys
 import logging
+import hashlib
+import tempfile
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 import argparse
-from typing import List, Dict
+from typing import List, Dict, Optional
 import time
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
+from openai import OpenAI, AsyncOpenAI
 
 # Add the parent directory to the path so we can import from src
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.latex_parser import parse_latex_file, Slide
 from src.chatgpt_script_generator import format_slide_for_chatgpt
-from src.simple_video_assembler import assemble_video
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Responses keyed by model, sampling settings and prompt; shared with the GUI
+LLM_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'llm')
+
+SYSTEM_PROMPT = "You are an expert educational content creator who specializes in creating clear, concise narration scripts for educational videos. You explain complex concepts in an accessible way, with special attention to mathematical formulas."
+
+def parse_concurrency(value, default: int) -> int:
+    """A concurrency setting as a positive int; default when it is unset or not a number."""
+    if value is None:
+        return default
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        logging.warning(f"Ignoring invalid concurrency setting {value!r}, using {default}")
+        return default
+
+def openai_concurrency(config: Dict) -> int:
+    """openai.concurrency from config, validated; 8 when it is not set."""
+    return parse_concurrency((config.get('openai') or {}).get('concurrency'), 8)
+
 def load_config(config_path: str) -> dict:
     """Loads configuration from YAML file."""
     logging.info(f"Attempting to load configuration from {config_path}")
@@ -28,7 +53,7 @@ def load_config(config_path: str) -> dict:
     try:
         logging.info(f"Opening configuration file: {config_path}")
         with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
         
         logging.info(f"Configuration loaded successfully from {config_path}")
         
@@ -94,6 +119,68 @@ def initialize_openai_client(config: Dict) -> OpenAI:
         logging.error(f"Traceback: {traceback.format_exc()}")
         return None
 
+def initialize_async_openai_client(config: Dict, http_client=None) -> AsyncOpenAI:
+    """Initialize an asynchronous OpenAI client with API key from config.
+    
+    Pass an httpx.AsyncClient as http_client to control connection pooling.
+    """
+    api_key = config.get('openai', {}).get('api_key')
+    if not api_key:
+        logging.error("OpenAI API key not found in config. Please add your API key to config/config.yaml")
+        return None
+    
+    try:
+        return AsyncOpenAI(api_key=api_key, http_client=http_client)
+    except Exception as e:
+        logging.error(f"Error initializing async OpenAI client: {e}")
+        return None
+
+def llm_cache_path(cache_dir: str, prompt: str, config: Dict) -> str:
+    """Cache file for the response to prompt with the configured model and sampling settings."""
+    openai_config = config.get('openai', {})
+    # Same defaults as generate_script_with_openai, so a changed setting never hits a stale entry
+    settings = (openai_config.get('model', 'gpt-4o'), openai_config.get('temperature', 0.7),
+                openai_config.get('max_tokens', 1000))
+    key = hashlib.sha256('\0'.join(map(str, settings + (prompt,))).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, key + '.txt')
+
+def store_llm_response(path: str, script: str) -> None:
+    """Atomically write a response into the LLM cache."""
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(script)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+async def generate_script_with_openai_async(client: AsyncOpenAI, prompt: str, config: Dict) -> str:
+    """Generate a script for a slide using the asynchronous OpenAI API."""
+    openai_config = config.get('openai', {})
+    model = openai_config.get('model', 'gpt-4o')
+    temperature = openai_config.get('temperature', 0.7)
+    max_tokens = openai_config.get('max_tokens', 1000)
+    
+    try:
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        script = response.choices[0].message.content.strip()
+        logging.info(f"Script generated successfully (length: {len(script)} characters)")
+        return script
+    except Exception as e:
+        logging.error(f"Error generating script with OpenAI: {e}")
+        return ""
+
 def generate_script_with_openai(client: OpenAI, prompt: str, config: Dict) -> str:
     """Generate a script for a slide using the OpenAI API."""
     openai_config = config.get('openai', {})
@@ -113,7 +200,7 @@ def generate_script_with_openai(client: OpenAI, prompt: str, config: Dict) -> st
         response = client.chat.completions.create(
             model=model,
             messages=[
-                {"role": "system", "content": "You are an expert educational content creator who specializes in creating clear, concise narration scripts for educational videos. You explain complex concepts in an accessible way, with special attention to mathematical formulas."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             temperature=temperature,
@@ -131,31 +218,47 @@ def generate_script_with_openai(client: OpenAI, prompt: str, config: Dict) -> st
         logging.error(f"Traceback: {traceback.format_exc()}")
         return ""
 
-def generate_all_scripts(slides: List[Slide], client: OpenAI, config: Dict) -> List[str]:
-    """Generate scripts for all slides using the OpenAI API."""
-    scripts = []
+def generate_all_scripts(slides: List[Slide], client: OpenAI, config: Dict,
+                         cache_dir: Optional[str] = None) -> List[str]:
+    """Generate scripts for all slides using the OpenAI API.
+    
+    Up to openai.concurrency slides (default 8) are requested at once; the
+    returned scripts are in slide order. With a cache_dir, responses are looked
+    up there first and new ones are stored, so unchanged slides skip the API.
+    """
+    concurrency = openai_concurrency(config)
     
-    for i, slide in enumerate(slides):
+    def generate_one(i: int, slide: Slide) -> str:
         logging.info(f"Generating script for slide {i+1}/{len(slides)}: {slide.title}")
         
         # Format the slide content for ChatGPT
         prompt = format_slide_for_chatgpt(slide)
         
+        cache_path = llm_cache_path(cache_dir, prompt, config) if cache_dir else None
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                logging.info(f"Using cached script for slide {i+1}")
+                return f.read()
+        
         # Generate script with OpenAI
         script = generate_script_with_openai(client, prompt, config)
         
         if script:
-            scripts.append(script)
+            if cache_path:
+                store_llm_response(cache_path, script)
             logging.info(f"Successfully generated script for slide {i+1}")
         else:
             logging.error(f"Failed to generate script for slide {i+1}")
             # Add a placeholder script to maintain alignment with slides
-            scripts.append(f"Script for slide {i+1} could not be generated.")
+            script = f"Script for slide {i+1} could not be generated."
         
-        # Add a small delay to avoid rate limiting
+        # Add a small delay to avoid rate limiting; each worker keeps the old one-request-per-second pace
         time.sleep(1)
+        return script
     
-    return scripts
+    # The blocking HTTP calls release the GIL, so threads overlap the round trips
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(generate_one, range(len(slides)), slides))
 
 def save_scripts_to_files(scripts: List[str], output_dir: str) -> List[str]:
     """Save generated scripts to files."""
@@ -216,7 +319,7 @@ def main():
     
     # Generate scripts for all slides
     logging.info(f"Generating scripts for {len(slides)} slides...")
-    scripts = generate_all_scripts(slides, client, config)
+    scripts = generate_all_scripts(slides, client, config, cache_dir=LLM_CACHE_DIR)
     
     # Save scripts to files
     logging.info(f"Saving scripts to {output_dir}...")
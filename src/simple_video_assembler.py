@@ -3,8 +3,13 @@ import os
 import logging
 import subprocess
 import tempfile
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Optional
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 import re
 
 # Try to import natsort, but provide a fallback if it's not available
@@ -32,7 +37,7 @@ def load_config(config_path: str = '../config/config.yaml') -> Dict:
     """Loads configuration from YAML file."""
     try:
         with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
         logging.info(f"Configuration loaded from {config_path}")
         return config
     except FileNotFoundError:
@@ -42,10 +47,77 @@ def load_config(config_path: str = '../config/config.yaml') -> Dict:
         logging.error(f"Error parsing configuration file {config_path}: {e}")
         return {}
 
-def assemble_video(image_files: List[str], audio_files: List[str], config: Dict) -> str:
+# Hardware H.264 encoders in order of preference
+HW_ENCODERS = ['h264_nvenc', 'h264_qsv', 'h264_videotoolbox']
+
+@lru_cache(maxsize=None)
+def detect_video_encoder(hwaccel: str = 'auto') -> str:
+    """
+    Picks the H.264 encoder to use. 'auto' prefers a hardware encoder listed by
+    `ffmpeg -encoders`, 'none' forces libx264, any other value is used as-is.
+    """
+    if hwaccel in (None, '', 'none', 'off', False):
+        return 'libx264'
+    if hwaccel != 'auto':
+        return hwaccel
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        for encoder in HW_ENCODERS:
+            if re.search(rf'\b{encoder}\b', result.stdout):
+                return encoder
+    except Exception as e:
+        logging.warning(f"Could not list ffmpeg encoders: {e}")
+    return 'libx264'
+
+def probe_duration(media_path: str) -> float:
+    """Returns the duration of a media file in seconds using ffprobe."""
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+         '-of', 'default=noprint_wrappers=1:nokey=1', media_path],
+        check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    return float(result.stdout.strip())
+
+def build_concat_command(segments: List[tuple], fps: int, encoder: str, output_path: str) -> List[str]:
+    """
+    Builds one ffmpeg command that loops each image for the length of its audio
+    and joins every slide with the concat filter, so the video is encoded once.
+    """
+    inputs = []
+    filters = []
+    labels = []
+    for i, (img_path, audio_path, duration) in enumerate(segments):
+        inputs += ['-loop', '1', '-framerate', str(fps), '-t', f"{duration:.3f}", '-i', img_path, '-i', audio_path]
+        filters.append(f"[{2 * i}:v]setsar=1,format=yuv420p[v{i}]")
+        filters.append(f"[{2 * i + 1}:a]aformat=sample_rates=44100:channel_layouts=stereo[a{i}]")
+        labels.append(f"[v{i}][a{i}]")
+    filters.append(f"{''.join(labels)}concat=n={len(segments)}:v=1:a=1[v][a]")
+    
+    if encoder == 'libx264':
+        video_codec = ['-c:v', 'libx264', '-preset', 'veryfast', '-tune', 'stillimage']
+    else:
+        video_codec = ['-c:v', encoder]
+    
+    return [
+        'ffmpeg', '-y',
+        *inputs,
+        '-filter_complex', ';'.join(filters),
+        '-map', '[v]', '-map', '[a]',
+        *video_codec,
+        '-pix_fmt', 'yuv420p',
+        '-r', str(fps),
+        '-c:a', 'aac',
+        '-b:a', '192k',
+        output_path
+    ]
+
+def assemble_video(image_files: List[str], audio_files: List[str], config: Dict, hwaccel: Optional[str] = None) -> str:
     """
     Assembles the video from images and audio using FFmpeg directly.
     This is a simplified version that avoids the moviepy library.
+    All slides are joined in a single ffmpeg run; hwaccel ('auto', 'none' or an
+    encoder name) defaults to ffmpeg.hwaccel from the config.
     """
     video_config = config.get('video', {})
     output_base_dir = config.get('output_dir', '../output')
@@ -116,63 +188,32 @@ def assemble_video(image_files: List[str], audio_files: List[str], config: Dict)
             processed_images.append(processed_path)
             logging.info(f"Created fallback image for {os.path.basename(img_path)}")
     
-    # Create individual video segments for each slide with its audio
-    video_segments = []
+    # Each slide lasts as long as its narration; a slide without a readable duration fails
+    # the assembly rather than being dropped, which would shift every later narration
+    segments = []
     for i, (img_path, audio_path) in enumerate(zip(processed_images, audio_files)):
-        segment_path = os.path.join(temp_dir, f"segment_{i+1:03d}.mp4")
-        
         try:
-            # Use ffmpeg to create a video segment from the image and audio
-            cmd = [
-                'ffmpeg', '-y',
-                '-loop', '1',
-                '-i', img_path,
-                '-i', audio_path,
-                '-c:v', 'libx264',
-                '-tune', 'stillimage',
-                '-c:a', 'aac',
-                '-b:a', '192k',
-                '-pix_fmt', 'yuv420p',
-                '-shortest',
-                segment_path
-            ]
-            
-            logging.info(f"Creating video segment {i+1}/{len(processed_images)}")
-            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            
-            video_segments.append(segment_path)
+            segments.append((img_path, audio_path, probe_duration(audio_path)))
         except Exception as e:
-            logging.error(f"Error creating video segment {i+1}: {e}")
+            logging.error(f"Error reading audio duration for slide {i+1} ({audio_path}): {e}. Cannot assemble video.")
+            return ""
     
-    if not video_segments:
-        logging.error("No video segments were created.")
-        return ""
+    if hwaccel is None:
+        hwaccel = config.get('ffmpeg', {}).get('hwaccel', 'auto')
+    encoder = detect_video_encoder(hwaccel)
     
-    # Create a file listing all video segments
-    segments_list_path = os.path.join(temp_dir, "segments.txt")
-    with open(segments_list_path, 'w') as f:
-        for segment in video_segments:
-            f.write(f"file '{segment}'\n")
-    
-    # Concatenate all segments into the final video
-    try:
-        cmd = [
-            'ffmpeg', '-y',
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', segments_list_path,
-            '-c', 'copy',
-            output_path
-        ]
-        
-        logging.info(f"Concatenating {len(video_segments)} video segments")
-        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        logging.info(f"Video successfully assembled: {output_path}")
-        return output_path
-    except Exception as e:
-        logging.error(f"Error concatenating video segments: {e}")
-        return ""
+    # Encode all slides in one pass, falling back to libx264 if the hardware encoder fails
+    for codec in dict.fromkeys([encoder, 'libx264']):
+        try:
+            cmd = build_concat_command(segments, fps, codec, output_path)
+            logging.info(f"Encoding {len(segments)} slides in a single pass with {codec}")
+            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            
+            logging.info(f"Video successfully assembled: {output_path}")
+            return output_path
+        except Exception as e:
+            logging.error(f"Error encoding video with {codec}: {e}")
+    return ""
 
 if __name__ == "__main__":
     import sys
@@ -5,6 +5,10 @@ from moviepy.video.fx.fadein import fadein
 from moviepy.video.fx.fadeout import fadeout
 from typing import List, Dict
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 from natsort import natsorted
 from PIL import Image
 
@@ -14,7 +18,7 @@ def load_config(config_path: str = '../config/config.yaml') -> Dict:
     """Loads configuration from YAML file."""
     try:
         with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
         logging.info(f"Configuration loaded from {config_path}")
         return config
     except FileNotFoundError:
@@ -0,0 +1,117 @@
+import os
+import shutil
+import tempfile
+import unittest
+from src.audio_cache import (audio_cache_key, load_audio_index, save_audio_index,
+                             restore_cached_audio, store_cached_audio)
+
+class FakeProvider:
+    """Stands in for a TTS provider: writes the text as the 'audio' and counts the calls"""
+    def __init__(self, voice='pt', slow=False):
+        self.voice = voice
+        self.slow = slow
+        self.calls = 0
+
+    def cache_settings(self):
+        return (self.voice, self.slow)
+
+    def generate_audio(self, text, output_path):
+        self.calls += 1
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return True
+
+class OtherProvider(FakeProvider):
+    pass
+
+class TestAudioCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp, 'cache')
+        self.audio_dir = os.path.join(self.tmp, 'audio')
+        os.makedirs(self.audio_dir)
+        self.output = os.path.join(self.audio_dir, 'audio_1.mp3')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def synthesize(self, provider, text, index=None):
+        """What generate_all_audio_async does per slide: restore, else synthesize and store"""
+        key = audio_cache_key(text, provider)
+        if restore_cached_audio(self.cache_dir, key, self.output, index):
+            return
+        self.assertTrue(provider.generate_audio(text, self.output))
+        store_cached_audio(self.cache_dir, key, self.output, index)
+
+    def test_key_is_stable(self):
+        self.assertEqual(audio_cache_key("Olá", FakeProvider()), audio_cache_key("Olá", FakeProvider()))
+
+    def test_key_depends_on_text_settings_and_provider(self):
+        key = audio_cache_key("Olá", FakeProvider())
+        self.assertNotEqual(key, audio_cache_key("Olá!", FakeProvider()))
+        self.assertNotEqual(key, audio_cache_key("Olá", FakeProvider(voice='en')))
+        self.assertNotEqual(key, audio_cache_key("Olá", FakeProvider(slow=True)))
+        self.assertNotEqual(key, audio_cache_key("Olá", OtherProvider()))
+
+    def test_second_run_does_not_call_provider(self):
+        provider = FakeProvider()
+        self.synthesize(provider, "Slide um")
+        self.synthesize(provider, "Slide um")
+        self.assertEqual(provider.calls, 1)
+
+    def test_index_fast_path_skips_the_copy(self):
+        provider = FakeProvider()
+        index = {}
+        self.synthesize(provider, "Slide um", index)
+        save_audio_index(self.audio_dir, index)
+        index = load_audio_index(self.audio_dir)
+        self.assertIn('audio_1.mp3', index)
+        # With the output untouched the index alone answers; the cached file is not needed
+        shutil.rmtree(self.cache_dir)
+        key = audio_cache_key("Slide um", provider)
+        self.assertTrue(restore_cached_audio(self.cache_dir, key, self.output, index))
+        self.assertEqual(provider.calls, 1)
+
+    def test_index_does_not_hide_a_changed_output(self):
+        provider = FakeProvider()
+        index = {}
+        self.synthesize(provider, "Slide um", index)
+        with open(self.output, 'w', encoding='utf-8') as f:
+            f.write("edited by hand")
+        key = audio_cache_key("Slide um", provider)
+        self.assertTrue(restore_cached_audio(self.cache_dir, key, self.output, index))
+        with open(self.output, encoding='utf-8') as f:
+            self.assertEqual(f.read(), "Slide um")
+
+    def test_restore_after_output_dir_is_cleared(self):
+        provider = FakeProvider()
+        index = {}
+        self.synthesize(provider, "Slide um", index)
+        save_audio_index(self.audio_dir, index)
+        shutil.rmtree(self.audio_dir)
+        os.makedirs(self.audio_dir)
+        index = load_audio_index(self.audio_dir)
+        self.assertEqual(index, {})
+        self.synthesize(provider, "Slide um", index)
+        self.assertEqual(provider.calls, 1)
+        with open(self.output, encoding='utf-8') as f:
+            self.assertEqual(f.read(), "Slide um")
+
+    def test_synthesizes_again_after_cache_is_cleared(self):
+        provider = FakeProvider()
+        self.synthesize(provider, "Slide um")
+        shutil.rmtree(self.cache_dir)
+        os.remove(self.output)
+        key = audio_cache_key("Slide um", provider)
+        self.assertFalse(restore_cached_audio(self.cache_dir, key, self.output))
+        self.synthesize(provider, "Slide um")
+        self.assertEqual(provider.calls, 2)
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, key + '.mp3')))
+
+    def test_unreadable_index_is_empty(self):
+        with open(os.path.join(self.audio_dir, 'index.json'), 'w', encoding='utf-8') as f:
+            f.write("{not json")
+        self.assertEqual(load_audio_index(self.audio_dir), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+from src.chatgpt_script_generator import (clean_chatgpt_response, format_slide_for_chatgpt,
+                                          _PHRASE_PATTERNS, _RE_ANY_PHRASE)
+from src.latex_parser import Slide
+
+class TestCleanChatGPTResponse(unittest.TestCase):
+    """Pins the output of clean_chatgpt_response for representative inputs"""
+
+    def test_markdown(self):
+        response = ("# Título\n**Negrito** e *itálico* com `código` e __forte__.\n"
+                    "- item um\n1. item dois\n```python\nprint(1)\n```")
+        self.assertEqual(clean_chatgpt_response(response),
+                         "Negrito e itálico com código e forte. item um item dois")
+
+    def test_greek_letters(self):
+        response = "A constante \\alpha vale \\pi e \\Omega é grande; \\lambda e \\mu também."
+        self.assertEqual(clean_chatgpt_response(response),
+                         "A constante alfa vale pi e Ômega maiúsculo é grande; lambda e mi também.")
+
+    def test_math(self):
+        response = "Temos $\\frac{a}{b} \\cdot x_1 + y^{2} \\leq \\sqrt{z}$ e \\(v_{max} \\approx \\infty\\)."
+        self.assertEqual(clean_chatgpt_response(response),
+                         "Temos a dividido por b vezes x1 + y sobrescrito 2 menor ou igual a raiz quadrada de z"
+                         " e v{max} aproximadamente igual a infinito.")
+
+    def test_leading_phrase_is_removed(self):
+        response = "Claro, aqui está:\nA energia se conserva.\nEspero que isso ajude!"
+        self.assertEqual(clean_chatgpt_response(response), "A energia se conserva. Espero que isso ajude!")
+
+    def test_markers_are_removed(self):
+        response = "[Início da Narração] Neste slide vemos a lei de Newton. [Fim da Narração]"
+        self.assertEqual(clean_chatgpt_response(response), "Neste slide vemos a lei de Newton.")
+
+    def test_response_without_phrases(self):
+        response = "Neste slide vemos a lei de Newton.\n> nota\n---\nE mais nada."
+        self.assertEqual(clean_chatgpt_response(response),
+                         "Neste slide vemos a lei de Newton. > nota --- E mais nada.")
+
+    def test_any_phrase_matches_where_a_single_phrase_does(self):
+        samples = [
+            "Neste slide vemos a lei de Newton.",
+            "Claro, aqui está: a lei de Newton.",
+            "A lei de Newton.\nEspero que esta narração seja útil.",
+            "SEGUE ABAIXO o script: texto",
+            "Texto [Fim] e {Início] no meio",
+            "O fim da narração não é um marcador",
+        ]
+        for sample in samples:
+            with self.subTest(sample=sample):
+                expected = any(pattern.search(sample) for pattern in _PHRASE_PATTERNS)
+                self.assertEqual(bool(_RE_ANY_PHRASE.search(sample)), expected)
+
+class TestFormatSlideForChatGPT(unittest.TestCase):
+    """Pins the prompt built by format_slide_for_chatgpt"""
+
+    def body(self, formatted):
+        return formatted.split("\n\n---\n\n")[0]
+
+    def test_inline_and_display_formulas(self):
+        slide = Slide(2, "Leis", "$F = ma$ e $$E = mc^2$$")
+        formatted = format_slide_for_chatgpt(slide)
+        self.assertEqual(self.body(formatted), "# Leis\n\nFORMULA: F = ma e FORMULA: E = mc^2")
+        self.assertIn("Dê atenção especial às fórmulas matemáticas", formatted)
+
+    def test_align_and_equation(self):
+        slides = [Slide(1, "Leis", "Texto"),
+                  Slide(2, "Leis", "\\begin{align}a &= b \\\\ c &= d\\end{align}"
+                                   "\\begin{equation}x=1\\end{equation}"),
+                  Slide(3, "Fim", "Obrigado")]
+        formatted = format_slide_for_chatgpt(slides[1], slides, 1)
+        self.assertEqual(self.body(formatted),
+                         "# Leis\n\n## Informação de Sequência\n- Este é o slide 2 de 3.\n"
+                         "- Slide anterior: \"Leis\"\n"
+                         "- Este slide é uma continuação do slide anterior com o mesmo título.\n"
+                         "- Próximo slide: \"Fim\"\n\n"
+                         "SISTEMA DE EQUAÇÕES:\nFORMULA: a = b\nFORMULA: c = dFORMULA: x=1")
+        self.assertIn("Este slide é uma continuação do slide anterior com o mesmo título.", formatted)
+
+    def test_title_page(self):
+        slides = [Slide(1, "Title Page", "Física I"), Slide(2, "Leis", "Texto")]
+        formatted = format_slide_for_chatgpt(slides[0], slides, 0)
+        self.assertEqual(self.body(formatted),
+                         "# Title Page\n\n## Informação de Sequência\n- Este é o slide 1 de 2.\n"
+                         "- Próximo slide: \"Leis\"\n\nFísica I")
+        self.assertIn("slide de título", formatted)
+
+    def test_empty_slide(self):
+        slides = [Slide(1, "Leis", "Texto anterior"), Slide(2, "Fim", "")]
+        formatted = format_slide_for_chatgpt(slides[1], slides, 1)
+        self.assertEqual(self.body(formatted),
+                         "# Fim\n\n## Informação de Sequência\n- Este é o slide 2 de 2.\n"
+                         "- Slide anterior: \"Leis\"\n\n"
+                         "[ATTENTION: This slide appears to have no content. It may be a transition slide"
+                         " or a slide meant for visual emphasis.]\n\n"
+                         "Previous slide title: \"Leis\"\nPrevious slide content summary: \"Texto anterior...\"")
+        self.assertIn("narração de transição", formatted)
+
+if __name__ == '__main__':
+    unittest.main()
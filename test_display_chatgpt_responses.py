@@ -0,0 +1,78 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import src.chatgpt_script_generator
+from display_chatgpt_responses import load_chatgpt_scripts, save_cleaned_scripts
+
+class TestLoadChatGPTScripts(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.responses_dir = os.path.join(self.tmp, 'chatgpt_responses')
+        self.cleaned_dir = os.path.join(self.tmp, 'cleaned_responses')
+        self.cache_dir = os.path.join(self.tmp, '.cache', 'cleaned')
+        os.makedirs(self.responses_dir)
+        self.write_response(1, "**Lei de Newton** com \\alpha")
+        self.write_response(2, "Claro, aqui está:\nA energia se conserva.")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write_response(self, number, text):
+        with open(os.path.join(self.responses_dir, f'slide_{number}_response.txt'), 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def set_mtime(self, directory, mtime):
+        for name in os.listdir(directory):
+            os.utime(os.path.join(directory, name), (mtime, mtime))
+
+    def load(self):
+        """Run load_chatgpt_scripts, counting the calls that reach the cleaner"""
+        real_clean = src.chatgpt_script_generator.clean_chatgpt_response
+        with patch('src.chatgpt_script_generator.clean_chatgpt_response', side_effect=real_clean) as clean:
+            scripts = list(load_chatgpt_scripts(self.responses_dir))
+        return scripts, clean.call_count
+
+    def test_cache_hit_skips_cleaning(self):
+        first, calls = self.load()
+        self.assertEqual(calls, 2)
+        self.assertEqual(first, [('slide_1_response.txt', "Lei de Newton com alfa"),
+                                 ('slide_2_response.txt', "A energia se conserva.")])
+        second, calls = self.load()
+        self.assertEqual(calls, 0)
+        self.assertEqual(second, first)
+
+    def test_stale_cache_entry_is_replaced(self):
+        self.load()
+        self.write_response(1, "Texto novo")
+        scripts, calls = self.load()
+        self.assertEqual(calls, 1)
+        self.assertEqual(scripts[0], ('slide_1_response.txt', "Texto novo"))
+        # The entry for the old content of slide 1 is pruned
+        entries = [name for name in os.listdir(self.cache_dir) if name.startswith('slide_1.')]
+        self.assertEqual(len(entries), 1)
+
+    def test_newer_cleaned_responses_are_promoted(self):
+        scripts, _ = self.load()
+        list(save_cleaned_scripts(iter(scripts), self.tmp))
+        shutil.rmtree(self.cache_dir)
+        self.set_mtime(self.responses_dir, 1000000)
+        self.set_mtime(self.cleaned_dir, 2000000)
+        promoted, calls = self.load()
+        self.assertEqual(calls, 0)
+        self.assertEqual([script for _, script in promoted], [script for _, script in scripts])
+        self.assertEqual([name for name, _ in promoted], ['slide_1_cleaned.txt', 'slide_2_cleaned.txt'])
+
+    def test_older_cleaned_responses_are_not_promoted(self):
+        scripts, _ = self.load()
+        list(save_cleaned_scripts(iter(scripts), self.tmp))
+        shutil.rmtree(self.cache_dir)
+        self.set_mtime(self.cleaned_dir, 1000000)
+        self.set_mtime(self.responses_dir, 2000000)
+        reloaded, calls = self.load()
+        self.assertEqual(calls, 2)
+        self.assertEqual(reloaded, scripts)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,12 +4,13 @@ import sys
 import unittest
 import logging
 import subprocess
+import yaml
 from unittest.mock import patch, MagicMock, mock_open
 
 # Add the parent directory to the path so we can import from src
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.image_generator import load_config, compile_latex_to_pdf, convert_pdf_to_images, generate_slide_images
+from src.image_generator import load_config, compile_latex_to_pdf, convert_pdf_to_images, generate_slide_images, SafeLoader
 
 class TestImageGenerator(unittest.TestCase):
     """Test the image_generator module comprehensively."""
@@ -59,12 +60,14 @@ class TestImageGenerator(unittest.TestCase):
         # Test with invalid YAML
         mock_file.side_effect = None
         mock_file.return_value.read.return_value = 'invalid: yaml: content:'
-        with patch('yaml.safe_load', side_effect=Exception("YAML Error")):
+        with patch('src.image_generator.yaml.load', side_effect=yaml.YAMLError("YAML Error")) as mock_load:
             config = load_config('invalid.yaml')
             self.assertEqual(config, {})
+            mock_load.assert_called_once()
+            self.assertIs(mock_load.call_args.kwargs['Loader'], SafeLoader)
     
     @patch('os.path.getsize')
-    @patch('shutil.copy2')
+    @patch('src.image_generator.copy_if_changed')
     @patch('subprocess.run')
     @patch('os.path.exists')
     def test_compile_latex_to_pdf(self, mock_exists, mock_run, mock_copy, mock_getsize):
@@ -87,7 +90,17 @@ class TestImageGenerator(unittest.TestCase):
         mock_process.returncode = 0
         mock_run.return_value = mock_process
         pdf_path = compile_latex_to_pdf(self.test_latex_file, self.test_pdf_dir)
-        self.assertIsNotNone(pdf_path)
+        expected_pdf = os.path.join(self.test_pdf_dir, self.test_pdf_file)
+        self.assertEqual(pdf_path, expected_pdf)
+        source_pdf = os.path.join(os.path.dirname(os.path.abspath(self.test_latex_file)), self.test_pdf_file)
+        mock_copy.assert_called_once_with(source_pdf, expected_pdf)
+
+        # The PDF is still usable from the source directory if copying it fails
+        mock_copy.side_effect = OSError("Test exception")
+        pdf_path = compile_latex_to_pdf(self.test_latex_file, self.test_pdf_dir)
+        self.assertEqual(pdf_path, source_pdf)
+        mock_copy.side_effect = None
+        mock_copy.reset_mock()
 
         # Test nonexistent LaTeX file
         self._tex_exists = False
@@ -108,6 +121,7 @@ class TestImageGenerator(unittest.TestCase):
 
         pdf_path = compile_latex_to_pdf(self.test_latex_file, self.test_pdf_dir)
         self.assertIsNone(pdf_path)
+        mock_copy.assert_not_called()
 
         # Test pdflatex command not found
         self._tex_exists = True
@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from PIL import Image
+from src.simple_video_assembler import build_concat_command, assemble_video
+
+class TestBuildConcatCommand(unittest.TestCase):
+    def setUp(self):
+        self.segments = [('slide_001.png', 'audio_1.mp3', 2.5), ('slide_002.png', 'audio_2.mp3', 10)]
+
+    def test_inputs_and_filter_graph(self):
+        cmd = build_concat_command(self.segments, 30, 'libx264', 'out.mp4')
+        self.assertEqual(cmd[:18], [
+            'ffmpeg', '-y',
+            '-loop', '1', '-framerate', '30', '-t', '2.500', '-i', 'slide_001.png', '-i', 'audio_1.mp3',
+            '-loop', '1', '-framerate', '30', '-t', '10.000',
+        ])
+        filter_graph = cmd[cmd.index('-filter_complex') + 1]
+        self.assertEqual(filter_graph.split(';'), [
+            '[0:v]setsar=1,format=yuv420p[v0]',
+            '[1:a]aformat=sample_rates=44100:channel_layouts=stereo[a0]',
+            '[2:v]setsar=1,format=yuv420p[v1]',
+            '[3:a]aformat=sample_rates=44100:channel_layouts=stereo[a1]',
+            '[v0][a0][v1][a1]concat=n=2:v=1:a=1[v][a]',
+        ])
+        self.assertEqual(cmd[-1], 'out.mp4')
+
+    def test_libx264_options(self):
+        cmd = build_concat_command(self.segments, 24, 'libx264', 'out.mp4')
+        self.assertIn('-tune', cmd)
+        self.assertEqual(cmd[cmd.index('-c:v') + 1], 'libx264')
+        self.assertEqual(cmd[cmd.index('-r') + 1], '24')
+
+    def test_hardware_encoder(self):
+        cmd = build_concat_command(self.segments, 30, 'h264_nvenc', 'out.mp4')
+        self.assertEqual(cmd[cmd.index('-c:v') + 1], 'h264_nvenc')
+        self.assertNotIn('-tune', cmd)
+
+class TestAssembleVideo(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.images = []
+        for i in range(2):
+            path = os.path.join(self.tmp, f'slide_{i + 1}.png')
+            Image.new('RGB', (32, 18), (255, 255, 255)).save(path)
+            self.images.append(path)
+        self.audio = [os.path.join(self.tmp, f'audio_{i + 1}.mp3') for i in range(2)]
+        self.config = {'output_dir': self.tmp, 'video': {'resolution': '64x36', 'fps': 30}}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_unreadable_duration_fails_the_assembly(self):
+        def probe(path):
+            if path.endswith('audio_2.mp3'):
+                raise ValueError("could not convert string to float: ''")
+            return 3.0
+        with patch('src.simple_video_assembler.probe_duration', side_effect=probe), \
+             patch('src.simple_video_assembler.subprocess.run') as run:
+            self.assertEqual(assemble_video(self.images, self.audio, self.config, hwaccel='none'), "")
+        run.assert_not_called()
+
+    def test_every_slide_is_encoded(self):
+        with patch('src.simple_video_assembler.probe_duration', return_value=3.0), \
+             patch('src.simple_video_assembler.subprocess.run') as run:
+            output = assemble_video(self.images, self.audio, self.config, hwaccel='none')
+        self.assertEqual(output, os.path.abspath(os.path.join(self.tmp, 'final_video.mp4')))
+        cmd = run.call_args[0][0]
+        self.assertIn('concat=n=2:v=1:a=1[v][a]', cmd[cmd.index('-filter_complex') + 1])
+        self.assertIn(self.audio[1], cmd)
+
+if __name__ == '__main__':
+    unittest.main()